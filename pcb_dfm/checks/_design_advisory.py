@@ -12,8 +12,9 @@ from __future__ import annotations
 from typing import List, Optional, Tuple
 
 from ..engine.context import CheckContext
+from ..geometry import queries
 from ..geometry.gerber_backend import outline_contours_mm
-from ..geometry.primitives import Point2D
+from ..geometry.primitives import Bounds, Point2D
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
 from .impl_min_annular_ring import _point_in_polygon
 
@@ -156,5 +157,29 @@ def is_pad_like(poly, min_area_mm2: float = 0.02, max_area_mm2: float = 25.0,
     return (long_ / short if short > 0.0 else 1.0) <= max_aspect
 
 
+def _build_pad_like_bounds(ctx) -> List[Tuple[str, Bounds]]:
+    out: List[Tuple[str, Bounds]] = []
+    for layer in queries.get_copper_layers(ctx.geometry):
+        for poly in layer.polygons:
+            if is_pad_like(poly):
+                out.append((layer.logical_layer, poly.bounds()))
+    return out
+
+
+def pad_like_bounds(ctx) -> List[Tuple[str, Bounds]]:
+    """``(logical_layer, bounds)`` of every copper polygon that passes
+    :func:`is_pad_like` at its default thresholds, in layer/polygon order.
+
+    Several checks start from the same pad population; this classifies the
+    copper once per run and shares the result through the geometry cache.
+    Callers must not mutate the returned bounds.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_pad_like_bounds(ctx)
+    return cache.get_or_compute(
+        cache.key("advisory", "pad_like_bounds"), lambda: _build_pad_like_bounds(ctx))
+
+
 def bbox_center(b) -> Tuple[float, float]:
     return 0.5 * (b.min_x + b.max_x), 0.5 * (b.min_y + b.max_y)
@@ -13,7 +13,11 @@ from __future__ import annotations
 from typing import Optional
 
 from ..engine.context import CheckContext
-from ..geometry.queries import MAX_PLAUSIBLE_EXTENT_MM, geometry_extent_plausible
+from ..geometry.queries import (
+    MAX_PLAUSIBLE_EXTENT_MM,
+    bounds_extent_plausible,
+    get_or_build_geometry_bounds,
+)
 from ..results import CheckResult, Violation
 
 
@@ -26,7 +30,7 @@ def implausible_extent_result(ctx: CheckContext) -> Optional[CheckResult]:
         if guard is not None:
             return guard
     """
-    if geometry_extent_plausible(ctx.geometry):
+    if bounds_extent_plausible(get_or_build_geometry_bounds(ctx)):
         return None
 
     return CheckResult(
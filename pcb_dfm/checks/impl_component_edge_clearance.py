@@ -15,7 +15,7 @@ from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
 from ..geometry import queries
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
-from ._design_advisory import is_pad_like, na
+from ._design_advisory import na, pad_like_bounds
 
 
 @register_check("component_edge_clearance")
@@ -24,28 +24,24 @@ def run_component_edge_clearance(ctx: CheckContext) -> CheckResult:
     recommended = float(limits.get("recommended_min", 0.5))
     absolute = float(limits.get("absolute_min", 0.3))
 
-    board = queries.get_board_bounds(ctx.geometry)
+    board = queries.get_or_build_board_bounds(ctx)
     if board is None:
         return na(ctx, "No board outline to measure component-to-edge clearance.", units="mm")
 
     min_clear: Optional[float] = None
     loc: Optional[ViolationLocation] = None
-    for layer in queries.get_copper_layers(ctx.geometry):
-        for poly in layer.polygons:
-            if not is_pad_like(poly):
-                continue
-            b = poly.bounds()
-            # Distance from this pad to each board edge; negative => overhang.
-            d = min(b.min_x - board.min_x, board.max_x - b.max_x,
-                    b.min_y - board.min_y, board.max_y - b.max_y)
-            if min_clear is None or d < min_clear:
-                min_clear = d
-                loc = ViolationLocation(
-                    layer=layer.logical_layer,
-                    x_mm=0.5 * (b.min_x + b.max_x),
-                    y_mm=0.5 * (b.min_y + b.max_y),
-                    notes="Component pad closest to the board edge.",
-                )
+    for layer_name, b in pad_like_bounds(ctx):
+        # Distance from this pad to each board edge; negative => overhang.
+        d = min(b.min_x - board.min_x, board.max_x - b.max_x,
+                b.min_y - board.min_y, board.max_y - b.max_y)
+        if min_clear is None or d < min_clear:
+            min_clear = d
+            loc = ViolationLocation(
+                layer=layer_name,
+                x_mm=0.5 * (b.min_x + b.max_x),
+                y_mm=0.5 * (b.min_y + b.max_y),
+                notes="Component pad closest to the board edge.",
+            )
 
     if min_clear is None:
         return na(ctx, "No component pads found to measure edge clearance.", units="mm")
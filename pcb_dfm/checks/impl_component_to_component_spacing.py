@@ -3,14 +3,29 @@ from __future__ import annotations
 import math
 from collections import defaultdict
 from math import floor
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
+from ..geometry.primitives import Bounds
 from ..results import CheckResult, Violation, ViolationLocation
 
 
-def _poly_area_mm2(poly) -> float:
+class _ClusterBBox(NamedTuple):
+    """Bounding box of one inferred component cluster, in mm.
+
+    A plain tuple: no per-instance ``__dict__`` and no Python-level
+    ``__init__``, so boards with thousands of clusters do not pay an object
+    allocation per cluster. Field names match ``Bounds`` so the bbox helpers
+    below accept either.
+    """
+    min_x: float
+    max_x: float
+    min_y: float
+    max_y: float
+
+
+def _poly_area_mm2(poly, b=None) -> float:
     if hasattr(poly, "area_mm2"):
         return float(poly.area_mm2)
     if hasattr(poly, "area"):
@@ -18,16 +33,20 @@ def _poly_area_mm2(poly) -> float:
             return float(poly.area())
         except TypeError:
             return float(poly.area)
-    b = poly.bounds()
+    if b is None:
+        b = poly.bounds()
     return max(0.0, (b.max_x - b.min_x) * (b.max_y - b.min_y))
 
 
-def _bbox_distance_mm(b1, b2) -> float:
-    dx = max(0.0, max(b1.min_x - b2.max_x, b2.min_x - b1.max_x))
-    dy = max(0.0, max(b1.min_y - b2.max_y, b2.min_y - b1.max_y))
-    if dx == 0.0 and dy == 0.0:
-        return 0.0
-    return math.hypot(dx, dy)
+def _bbox_gap_sq_mm2(b1, b2) -> float:
+    """Squared gap between two bboxes (0 when they overlap).
+
+    Comparisons only need the square, so hot loops rank pairs by this and
+    take a single square root for the winner.
+    """
+    dx = max(b1.min_x - b2.max_x, b2.min_x - b1.max_x, 0.0)
+    dy = max(b1.min_y - b2.max_y, b2.min_y - b1.max_y, 0.0)
+    return dx * dx + dy * dy
 
 
 def _bbox_closest_points(b1, b2) -> Tuple[float, float, float, float, float]:
@@ -76,8 +95,7 @@ def _center_of_bounds(b) -> Tuple[float, float]:
     return (0.5 * (b.min_x + b.max_x), 0.5 * (b.min_y + b.max_y))
 
 
-def _is_via_like(poly, via_like_max_diameter_mm: float, via_like_max_area_mm2: float, via_like_roundness: float) -> bool:
-    b = poly.bounds()
+def _is_via_like(poly, b, via_like_max_diameter_mm: float, via_like_max_area_mm2: float, via_like_roundness: float) -> bool:
     w = max(0.0, b.max_x - b.min_x)
     h = max(0.0, b.max_y - b.min_y)
     if w <= 0.0 or h <= 0.0:
@@ -95,7 +113,7 @@ def _is_via_like(poly, via_like_max_diameter_mm: float, via_like_max_area_mm2: f
     if aspect > via_like_roundness:
         return False
 
-    area = _poly_area_mm2(poly)
+    area = _poly_area_mm2(poly, b)
     return area <= via_like_max_area_mm2
 
 
@@ -125,7 +143,7 @@ def _components_from_design_data(ctx: CheckContext, side_key: str):
     return out or None
 
 
-def _label_by_component(pad_polys, design_pads, max_match_mm: float):
+def _label_by_component(pad_cx, pad_cy, design_pads, max_match_mm: float):
     """Map each copper/mask feature to a component ref via its nearest design pad.
 
     Geometry has to come from the artwork -- design-data pads are points and
@@ -136,19 +154,21 @@ def _label_by_component(pad_polys, design_pads, max_match_mm: float):
     they cannot participate in component-to-component spacing.
     """
     labels: List[Optional[str]] = []
-    for _poly, cx, cy in pad_polys:
+    for cx, cy in zip(pad_cx, pad_cy):
         best_ref: Optional[str] = None
-        best_d = max_match_mm
+        best_d2 = max_match_mm * max_match_mm
         for ref, px, py in design_pads:
-            d = math.hypot(px - cx, py - cy)
-            if d <= best_d:
-                best_d = d
+            dx = px - cx
+            dy = py - cy
+            d2 = dx * dx + dy * dy
+            if d2 <= best_d2:
+                best_d2 = d2
                 best_ref = ref
         labels.append(best_ref)
     return labels
 
 
-def _is_pad_plausible(poly, min_area_mm2: float, max_area_mm2: float, max_aspect: float) -> bool:
+def _is_pad_plausible(poly, b, min_area_mm2: float, max_area_mm2: float, max_aspect: float) -> bool:
     """Could this polygon be a single component pad?
 
     Screens out both the too-small (degenerate pour-boundary artifacts) and the
@@ -156,10 +176,9 @@ def _is_pad_plausible(poly, min_area_mm2: float, max_area_mm2: float, max_aspect
     for the solder-mask and the copper candidate sources alike, so one stray
     board-scale region cannot become a "component".
     """
-    area = _poly_area_mm2(poly)
+    area = _poly_area_mm2(poly, b)
     if area < min_area_mm2 or area > max_area_mm2:
         return False
-    b = poly.bounds()
     w = max(0.0, b.max_x - b.min_x)
     h = max(0.0, b.max_y - b.min_y)
     if w <= 0.0 or h <= 0.0:
@@ -172,6 +191,58 @@ def _cell_key(x: float, y: float, cell: float) -> Tuple[int, int]:
     return (int(floor(x / cell)), int(floor(y / cell)))
 
 
+class _PadCandidates(NamedTuple):
+    """Pad-like features of one layer type, as parallel per-feature columns.
+
+    Bounds are taken once per polygon here and reused by every later pass
+    (via filter, clustering, pair spacing), which previously re-derived them
+    from the vertex list on each visit.
+    """
+    bounds: List[Bounds]
+    cx: List[float]
+    cy: List[float]
+    is_via: List[bool]
+
+
+def _collect_pad_candidates(
+    geom,
+    layer_type_key: str,
+    side_key: str,
+    pad_args: Tuple[float, float, float],
+    via_args: Tuple[float, float, float],
+) -> _PadCandidates:
+    layers = []
+    for layer in getattr(geom, "layers", []):
+        layer_type = getattr(layer, "layer_type", getattr(layer, "type", None))
+        side = getattr(layer, "side", "Unknown") or "Unknown"
+        if layer_type == layer_type_key and side.lower() == side_key:
+            layers.append(layer)
+
+    # Size the columns up front from the polygon count and trim afterwards,
+    # rather than growing four lists one append at a time.
+    n_max = sum(len(getattr(layer, "polygons", [])) for layer in layers)
+    slots: List[Optional[Bounds]] = [None] * n_max
+    cxs = [0.0] * n_max
+    cys = [0.0] * n_max
+    is_via = [False] * n_max
+
+    n = 0
+    for layer in layers:
+        for poly in getattr(layer, "polygons", []):
+            b = poly.bounds()
+            if not _is_pad_plausible(poly, b, *pad_args):
+                continue
+            slots[n] = b
+            cxs[n], cys[n] = _center_of_bounds(b)
+            is_via[n] = _is_via_like(poly, b, *via_args)
+            n += 1
+
+    del cxs[n:], cys[n:], is_via[n:]
+    # Every filled slot holds a Bounds; this also narrows the column's type.
+    bounds = [sb for sb in slots[:n] if sb is not None]
+    return _PadCandidates(bounds, cxs, cys, is_via)
+
+
 @register_check("component_to_component_spacing")
 def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
     """
@@ -231,43 +302,19 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
 
     geom = ctx.geometry
 
+    pad_args = (pad_min_area_mm2, pad_max_area_mm2, pad_max_aspect_ratio)
+    via_args = (via_like_max_diameter_mm, via_like_max_area_mm2, via_like_roundness)
+
     # Collect candidate polys from TopSolderMask first
-    candidates: List[Tuple[object, float, float, bool]] = []  # (poly, cx, cy, is_via_like)
+    candidates = _collect_pad_candidates(geom, "mask", "top", pad_args, via_args)
     used_source = "mask"
 
-    for layer in getattr(geom, "layers", []):
-        layer_type = getattr(layer, "layer_type", getattr(layer, "type", None))
-        side = getattr(layer, "side", "Unknown") or "Unknown"
-        if layer_type != "mask" or side.lower() != "top":
-            continue
-        for poly in getattr(layer, "polygons", []):
-            if not _is_pad_plausible(poly, pad_min_area_mm2, pad_max_area_mm2, pad_max_aspect_ratio):
-                continue
-            b = poly.bounds()
-            cx, cy = _center_of_bounds(b)
-            is_via = _is_via_like(poly, via_like_max_diameter_mm, via_like_max_area_mm2, via_like_roundness)
-            candidates.append((poly, cx, cy, is_via))
-
     # Fallback to TopCopper pad-like polygons if mask is missing
-    if len(candidates) < 2:
-        candidates = []
+    if len(candidates.bounds) < 2:
+        candidates = _collect_pad_candidates(geom, "copper", "top", pad_args, via_args)
         used_source = "copper"
-        for layer in getattr(geom, "layers", []):
-            layer_type = getattr(layer, "layer_type", getattr(layer, "type", None))
-            side = getattr(layer, "side", "Unknown") or "Unknown"
-            if layer_type != "copper" or side.lower() != "top":
-                continue
-
-            for poly in getattr(layer, "polygons", []):
-                if not _is_pad_plausible(poly, pad_min_area_mm2, pad_max_area_mm2, pad_max_aspect_ratio):
-                    continue
 
-                b = poly.bounds()
-                cx, cy = _center_of_bounds(b)
-                is_via = _is_via_like(poly, via_like_max_diameter_mm, via_like_max_area_mm2, via_like_roundness)
-                candidates.append((poly, cx, cy, is_via))
-
-    if len(candidates) < 2:
+    if len(candidates.bounds) < 2:
         viol = Violation(
             severity="info",
             message="Too few top side pad-like features (mask or copper) to estimate component spacing.",
@@ -293,7 +340,11 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
         )
 
     # Filter out isolated via-like features so vias do not become components.
-    non_via_centers = [(cx, cy) for _, cx, cy, is_via in candidates if not is_via]
+    non_via_centers = [
+        (cx, cy)
+        for cx, cy, is_via in zip(candidates.cx, candidates.cy, candidates.is_via)
+        if not is_via
+    ]
 
     # Grid index for neighbor queries
     cell_nv = max(keep_via_if_within_mm, 0.25)
@@ -301,10 +352,11 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
     for nx, ny in non_via_centers:
         grid_nv[_cell_key(nx, ny, cell_nv)].append((nx, ny))
 
-    filtered: List[Tuple[object, float, float]] = []
-    for poly, cx, cy, is_via in candidates:
+    keep_via_r2 = keep_via_if_within_mm * keep_via_if_within_mm
+    kept: List[int] = []
+    for idx, (cx, cy, is_via) in enumerate(zip(candidates.cx, candidates.cy, candidates.is_via)):
         if not is_via:
-            filtered.append((poly, cx, cy))
+            kept.append(idx)
             continue
 
         keep = False
@@ -313,7 +365,11 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
         for di in (-1, 0, 1):
             for dj in (-1, 0, 1):
                 for nx, ny in grid_nv.get((ci + di, cj + dj), []):
-                    if math.hypot(nx - cx, ny - cy) <= keep_via_if_within_mm:
+                    dx = nx - cx
+                    if dx * dx > keep_via_r2:
+                        continue
+                    dy = ny - cy
+                    if dx * dx + dy * dy <= keep_via_r2:
                         keep = True
                         break
                 if keep:
@@ -322,11 +378,13 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
                 break
 
         if keep:
-            filtered.append((poly, cx, cy))
+            kept.append(idx)
 
-    pad_polys: List[Tuple[object, float, float]] = filtered
+    pad_bounds = [candidates.bounds[idx] for idx in kept]
+    pad_cx = [candidates.cx[idx] for idx in kept]
+    pad_cy = [candidates.cy[idx] for idx in kept]
 
-    if len(pad_polys) < 2:
+    if len(pad_bounds) < 2:
         viol = Violation(
             severity="info",
             message="After filtering via-like features, too few candidates remain to estimate component spacing.",
@@ -352,8 +410,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
         )
 
     # Grid for clustering neighbor search
-    centers: List[Tuple[float, float]] = []
-    n = len(pad_polys)
+    n = len(pad_bounds)
 
     if n < 2:
         viol = Violation(
@@ -383,9 +440,8 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
     cell_c = max(cluster_radius_mm, 0.25)
     grid_c: Dict[Tuple[int, int], List[int]] = defaultdict(list)
 
-    for idx, (_poly, cx, cy) in enumerate(pad_polys):
-        centers.append((cx, cy))
-        grid_c[_cell_key(cx, cy, cell_c)].append(idx)
+    for idx in range(n):
+        grid_c[_cell_key(pad_cx[idx], pad_cy[idx], cell_c)].append(idx)
 
     # Prefer real component identity over geometric clustering when the board
     # supplies placement data (#14). Clustering pads by proximity cannot tell a
@@ -396,7 +452,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
     clusters: List[List[int]] = []
     design_pads = _components_from_design_data(ctx, "top")
     if design_pads:
-        labels = _label_by_component(pad_polys, design_pads, cluster_radius_mm * 2.0)
+        labels = _label_by_component(pad_cx, pad_cy, design_pads, cluster_radius_mm * 2.0)
         by_ref: Dict[str, List[int]] = defaultdict(list)
         for idx, ref in enumerate(labels):
             if ref is not None:
@@ -406,6 +462,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
             used_source = f"{used_source}+placement"
 
     if not clusters:
+        cluster_r2 = cluster_radius_mm * cluster_radius_mm
         visited = [False] * n
 
         for i in range(n):
@@ -418,7 +475,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
             while stack:
                 k = stack.pop()
                 cluster.append(k)
-                ckx, cky = centers[k]
+                ckx, cky = pad_cx[k], pad_cy[k]
                 ci, cj = _cell_key(ckx, cky, cell_c)
 
                 # Only check points in nearby cells
@@ -427,8 +484,13 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
                         for j in grid_c.get((ci + di, cj + dj), []):
                             if visited[j]:
                                 continue
-                            cjx, cjy = centers[j]
-                            near = math.hypot(cjx - ckx, cjy - cky) <= cluster_radius_mm
+                            # Most neighbours in a 3x3 cell block are already out of
+                            # range on X alone; only finish the distance when not.
+                            dx = pad_cx[j] - ckx
+                            near = False
+                            if dx * dx <= cluster_r2:
+                                dy = pad_cy[j] - cky
+                                near = dx * dx + dy * dy <= cluster_r2
                             # Two pads whose shapes physically overlap cannot belong
                             # to different components -- that is one footprint, not a
                             # collision. Without this, a coarse cluster_radius_mm
@@ -436,9 +498,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
                             # radius) into "components" whose own pads overlap, and
                             # the check reports 0.00 mm spacing against itself (#14).
                             if not near:
-                                *_, gap = _bbox_closest_points(
-                                    pad_polys[k][0].bounds(), pad_polys[j][0].bounds())
-                                near = gap <= 0.0
+                                near = _bbox_gap_sq_mm2(pad_bounds[k], pad_bounds[j]) <= 0.0
                             if near:
                                 visited[j] = True
                                 stack.append(j)
@@ -471,16 +531,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
         )
 
     # Build a bbox per cluster
-    class _BBox:
-        __slots__ = ("min_x", "max_x", "min_y", "max_y")
-
-        def __init__(self, min_x, max_x, min_y, max_y):
-            self.min_x = min_x
-            self.max_x = max_x
-            self.min_y = min_y
-            self.max_y = max_y
-
-    cluster_bboxes: List[_BBox] = []
+    cluster_bboxes: List[_ClusterBBox] = []
     for cluster in clusters:
         min_x = math.inf
         max_x = -math.inf
@@ -488,8 +539,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
         max_y = -math.inf
 
         for idx in cluster:
-            poly, _, _ = pad_polys[idx]
-            b = poly.bounds()
+            b = pad_bounds[idx]
             min_x = min(min_x, b.min_x)
             max_x = max(max_x, b.max_x)
             min_y = min(min_y, b.min_y)
@@ -498,7 +548,7 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
         if not math.isfinite(min_x) or not math.isfinite(max_x):
             continue
 
-        cluster_bboxes.append(_BBox(min_x, max_x, min_y, max_y))
+        cluster_bboxes.append(_ClusterBBox(min_x, max_x, min_y, max_y))
 
     if len(cluster_bboxes) < 2:
         viol = Violation(
@@ -549,37 +599,45 @@ def run_component_to_component_spacing(ctx: CheckContext) -> CheckResult:
 
     cell_p = max(cluster_radius_mm, 1.0)
     grid_p: Dict[Tuple[int, int], List[int]] = defaultdict(list)
-    for idx, (_poly, cx, cy) in enumerate(pad_polys):
-        grid_p[_cell_key(cx, cy, cell_p)].append(idx)
+    for idx in range(n):
+        grid_p[_cell_key(pad_cx[idx], pad_cy[idx], cell_p)].append(idx)
 
-    min_spacing = math.inf
-    best_midpoint: Optional[Tuple[float, float]] = None
+    # Track the squared gap; the closest points (for the marker) and the one
+    # square root are only computed when a pair actually improves on it.
+    min_spacing_sq = math.inf
+    best_pair = None
 
-    for i, (poly_i, cx, cy) in enumerate(pad_polys):
-        ci_key, cj_key = _cell_key(cx, cy, cell_p)
-        bi = poly_i.bounds()
+    for i in range(n):
+        ci_key, cj_key = _cell_key(pad_cx[i], pad_cy[i], cell_p)
+        bi = pad_bounds[i]
         for di in (-1, 0, 1):
             for dj in (-1, 0, 1):
                 for j in grid_p.get((ci_key + di, cj_key + dj), []):
                     if j <= i or cluster_of.get(i) == cluster_of.get(j):
                         continue
-                    bj = pad_polys[j][0].bounds()
-                    x1, y1, x2, y2, d = _bbox_closest_points(bi, bj)
-                    if d < min_spacing:
-                        min_spacing = d
-                        best_midpoint = (0.5 * (x1 + x2), 0.5 * (y1 + y2))
+                    bj = pad_bounds[j]
+                    d2 = _bbox_gap_sq_mm2(bi, bj)
+                    if d2 < min_spacing_sq:
+                        min_spacing_sq = d2
+                        best_pair = (bi, bj)
 
-    if not math.isfinite(min_spacing):
+    if best_pair is None:
         # No cross-cluster pad pair within the search neighbourhood: the
         # components are far apart, so the coarse cluster-bbox distance is a
         # perfectly good answer and precision does not matter here.
         m = len(cluster_bboxes)
         for i in range(m):
             for j in range(i + 1, m):
-                x1, y1, x2, y2, d = _bbox_closest_points(cluster_bboxes[i], cluster_bboxes[j])
-                if d < min_spacing:
-                    min_spacing = d
-                    best_midpoint = (0.5 * (x1 + x2), 0.5 * (y1 + y2))
+                d2 = _bbox_gap_sq_mm2(cluster_bboxes[i], cluster_bboxes[j])
+                if d2 < min_spacing_sq:
+                    min_spacing_sq = d2
+                    best_pair = (cluster_bboxes[i], cluster_bboxes[j])
+
+    min_spacing = math.sqrt(min_spacing_sq)
+    best_midpoint: Optional[Tuple[float, float]] = None
+    if best_pair is not None:
+        x1, y1, x2, y2, _d = _bbox_closest_points(*best_pair)
+        best_midpoint = (0.5 * (x1 + x2), 0.5 * (y1 + y2))
 
     best_pair_is_touching = min_spacing <= spacing_epsilon_mm
 
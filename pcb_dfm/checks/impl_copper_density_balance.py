@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import math
-from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
@@ -62,6 +61,61 @@ def _bbox_overlap_with_window(
     return (ix_max - ix_min) * (iy_max - iy_min)
 
 
+def _density_grid(
+    bboxes: Sequence,
+    bx_min: float,
+    by_min: float,
+    window_size_mm: float,
+    win_x0: List[float],
+    win_x1: List[float],
+    win_y0: List[float],
+    win_y1: List[float],
+    min_window_copper_area_mm2: float,
+) -> List[List[float]]:
+    """Rasterise one layer's copper bboxes into a [iy][ix] density grid (0..1).
+
+    Self-contained on plain floats and sequences (no context, no polygons), so
+    the run loop only handles layers and reporting around it.
+    """
+    nx = len(win_x0)
+    ny = len(win_y0)
+
+    # Scatter each bbox's clipped overlap straight into the windows it spans.
+    # Every window is written only by the bboxes that reach it, and in bbox
+    # order, so the sums match a per-window gather without first building a
+    # window -> bbox bin map.
+    copper_area = [[0.0] * nx for _ in range(ny)]
+    for b in bboxes:
+        # bbox span -> window index span, clamped to [0..nx-1], [0..ny-1]
+        ix0 = int(max(0, math.floor((b.min_x - bx_min) / window_size_mm)))
+        ix1 = int(min(nx - 1, math.floor((b.max_x - bx_min) / window_size_mm)))
+        iy0 = int(max(0, math.floor((b.min_y - by_min) / window_size_mm)))
+        iy1 = int(min(ny - 1, math.floor((b.max_y - by_min) / window_size_mm)))
+        for iy in range(iy0, iy1 + 1):
+            row = copper_area[iy]
+            wy_min = win_y0[iy]
+            wy_max = win_y1[iy]
+            for ix in range(ix0, ix1 + 1):
+                row[ix] += _bbox_overlap_with_window(b, win_x0[ix], win_x1[ix], wy_min, wy_max)
+
+    window_density = [[0.0] * nx for _ in range(ny)]
+    for iy in range(ny):
+        for ix in range(nx):
+            w_area = max(0.0, (win_x1[ix] - win_x0[ix]) * (win_y1[iy] - win_y0[iy]))
+            if w_area <= 0.0:
+                continue
+
+            area = copper_area[iy][ix]
+            if area < min_window_copper_area_mm2:
+                density = 0.0
+            else:
+                density = max(0.0, min(1.0, area / w_area))
+
+            window_density[iy][ix] = density
+
+    return window_density
+
+
 @register_check("copper_density_balance")
 def run_copper_density_balance(ctx: CheckContext) -> CheckResult:
     """
@@ -213,76 +267,44 @@ def run_copper_density_balance(ctx: CheckContext) -> CheckResult:
             violations=[viol],
         )
 
-    # Bin copper bboxes into the windows they overlap so each window only checks
-    # local candidates. bins[(iy, ix)] -> list of indices into copper_bboxes.
     max_delta = 0.0
     worst_center_x = None
     worst_center_y = None
 
-    def _record_delta(d: float, x_center: float, y_center: float):
-        nonlocal max_delta, worst_center_x, worst_center_y
-        if d > max_delta:
-            max_delta = d
-            worst_center_x = x_center
-            worst_center_y = y_center
+    # Window edges, shared by every layer. The last column/row is clipped to
+    # the board, exactly as the windows themselves are.
+    win_x0 = [bx_min + ix * window_size_mm for ix in range(nx)]
+    win_x1 = [min(bx_min + (ix + 1) * window_size_mm, bx_max) for ix in range(nx)]
+    win_y0 = [by_min + iy * window_size_mm for iy in range(ny)]
+    win_y1 = [min(by_min + (iy + 1) * window_size_mm, by_max) for iy in range(ny)]
 
     for _layer_name, copper_bboxes in bboxes_by_layer:
-        window_density = [[0.0 for _ in range(nx)] for _ in range(ny)]
-        bins: Dict[Tuple[int, int], List[int]] = defaultdict(list)
-
-        for pi, b in enumerate(copper_bboxes):
-            # bbox span -> window index span, clamped to [0..nx-1], [0..ny-1]
-            ix0 = int(max(0, math.floor((b.min_x - bx_min) / window_size_mm)))
-            ix1 = int(min(nx - 1, math.floor((b.max_x - bx_min) / window_size_mm)))
-            iy0 = int(max(0, math.floor((b.min_y - by_min) / window_size_mm)))
-            iy1 = int(min(ny - 1, math.floor((b.max_y - by_min) / window_size_mm)))
-            for iy in range(iy0, iy1 + 1):
-                for ix in range(ix0, ix1 + 1):
-                    bins[(iy, ix)].append(pi)
-
-        # Density per window, for this layer.
-        for iy in range(ny):
-            for ix in range(nx):
-                wx_min = bx_min + ix * window_size_mm
-                wx_max = min(bx_min + (ix + 1) * window_size_mm, bx_max)
-                wy_min = by_min + iy * window_size_mm
-                wy_max = min(by_min + (iy + 1) * window_size_mm, by_max)
-
-                w_area = max(0.0, (wx_max - wx_min) * (wy_max - wy_min))
-                if w_area <= 0.0:
-                    window_density[iy][ix] = 0.0
-                    continue
-
-                copper_area = 0.0
-                for pi in bins.get((iy, ix), []):
-                    b = copper_bboxes[pi]
-                    copper_area += _bbox_overlap_with_window(b, wx_min, wx_max, wy_min, wy_max)
-
-                if copper_area < min_window_copper_area_mm2:
-                    density = 0.0
-                else:
-                    density = max(0.0, min(1.0, copper_area / w_area))
-
-                window_density[iy][ix] = density
+        window_density = _density_grid(
+            copper_bboxes, bx_min, by_min, window_size_mm,
+            win_x0, win_x1, win_y0, win_y1, min_window_copper_area_mm2,
+        )
 
         # Max density delta between neighbouring windows, for this layer. The
         # board's figure is the worst layer's.
         for iy in range(ny):
+            row = window_density[iy]
+            below = window_density[iy + 1] if iy + 1 < ny else None
             for ix in range(nx):
-                d_here = window_density[iy][ix]
-
-                wx0 = bx_min + ix * window_size_mm
-                wx1 = min(bx_min + (ix + 1) * window_size_mm, bx_max)
-                wy0 = by_min + iy * window_size_mm
-                wy1 = min(by_min + (iy + 1) * window_size_mm, by_max)
-
-                if ix + 1 < nx:  # right neighbour: shared boundary x = wx1
-                    _record_delta(abs(d_here - window_density[iy][ix + 1]),
-                                  wx1, 0.5 * (wy0 + wy1))
-
-                if iy + 1 < ny:  # down neighbour: shared boundary y = wy1
-                    _record_delta(abs(d_here - window_density[iy + 1][ix]),
-                                  0.5 * (wx0 + wx1), wy1)
+                d_here = row[ix]
+
+                if ix + 1 < nx:  # right neighbour: shared boundary x = win_x1
+                    d = abs(d_here - row[ix + 1])
+                    if d > max_delta:
+                        max_delta = d
+                        worst_center_x = win_x1[ix]
+                        worst_center_y = 0.5 * (win_y0[iy] + win_y1[iy])
+
+                if below is not None:  # down neighbour: shared boundary y = win_y1
+                    d = abs(d_here - below[ix])
+                    if d > max_delta:
+                        max_delta = d
+                        worst_center_x = 0.5 * (win_x0[ix] + win_x1[ix])
+                        worst_center_y = win_y1[iy]
 
     # Convert to percent
     max_delta_percent = max_delta * 100.0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+import math
+from typing import List, NamedTuple, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
@@ -8,6 +9,28 @@ from ..geometry import queries
 from ..results import CheckResult, Violation, ViolationLocation
 
 
+class _SliverFilter(NamedTuple):
+    """Sliver candidate thresholds (mm / mm^2), parsed once per check invocation."""
+    min_area_mm2: float
+    min_aspect_ratio: float
+    min_long_dim_mm: float
+    max_short_dim_mm: float
+    ignore_tiny_feature_area_mm2: float
+    min_candidate_short_dim_mm: float
+
+
+def _parse_sliver_filter(raw_cfg) -> _SliverFilter:
+    return _SliverFilter(
+        min_area_mm2=float(raw_cfg.get("min_area_mm2", 0.02)),
+        min_aspect_ratio=float(raw_cfg.get("min_aspect_ratio", 4.0)),
+        min_long_dim_mm=float(raw_cfg.get("min_long_dim_mm", 0.5)),
+        max_short_dim_mm=float(raw_cfg.get("max_short_dim_mm", 0.3)),
+        ignore_tiny_feature_area_mm2=float(raw_cfg.get("ignore_tiny_feature_area_mm2", 0.005)),
+        # Lower bound on candidate short dimension so we ignore ultra tiny artifacts
+        min_candidate_short_dim_mm=float(raw_cfg.get("min_candidate_short_dim_mm", 0.05)),
+    )
+
+
 def _poly_vertices(poly) -> List[Tuple[float, float]]:
     """Extract (x, y) vertices in mm from a geometry Polygon."""
     verts = getattr(poly, "vertices", None)
@@ -62,7 +85,7 @@ def _longest_extent(pts: List[Tuple[float, float]], bbox_diag: float) -> float:
     return max_d2 ** 0.5
 
 
-def _estimate_width_mm(poly, short_dim: float, bbox_diag: float) -> float:
+def _estimate_width_mm(area: float, short_dim: float, length: float) -> float:
     """
     Estimate the true minimum width of an elongated copper polygon.
 
@@ -74,10 +97,10 @@ def _estimate_width_mm(poly, short_dim: float, bbox_diag: float) -> float:
     measures the same as an axis-aligned one. We take the smaller of that estimate
     and the bbox short dimension so the result is never a worse over-estimate than
     the old bbox measure.
+
+    Takes the polygon's (shoelace) area rather than its vertices: the caller
+    evaluates this at the bbox diagonal as well as at the true extent.
     """
-    pts = _poly_vertices(poly)
-    area = _shoelace_area(pts)
-    length = _longest_extent(pts, bbox_diag)
     if area <= 0.0 or length <= 0.0:
         return short_dim
     mean_width = area / length
@@ -116,16 +139,18 @@ def run_copper_sliver_width(ctx: CheckContext) -> CheckResult:
     recommended_min = float(limits.get("recommended_min", 0.15))  # mm
     absolute_min = float(limits.get("absolute_min", 0.10))        # mm
 
-    raw_cfg = ctx.check_def.raw or {}
-
-    # Filtering thresholds (all in mm / mm^2)
-    min_area_mm2 = float(raw_cfg.get("min_area_mm2", 0.02))
-    min_aspect_ratio = float(raw_cfg.get("min_aspect_ratio", 4.0))
-    min_long_dim_mm = float(raw_cfg.get("min_long_dim_mm", 0.5))
-    max_short_dim_mm = float(raw_cfg.get("max_short_dim_mm", 0.3))
-    ignore_tiny_feature_area_mm2 = float(raw_cfg.get("ignore_tiny_feature_area_mm2", 0.005))
-    # New: lower bound on candidate short dimension so we ignore ultra tiny artifacts
-    min_candidate_short_dim_mm = float(raw_cfg.get("min_candidate_short_dim_mm", 0.05))
+    # Filtering thresholds, unpacked into locals for the per-polygon loop.
+    (
+        min_area_mm2,
+        min_aspect_ratio,
+        min_long_dim_mm,
+        max_short_dim_mm,
+        ignore_tiny_feature_area_mm2,
+        min_candidate_short_dim_mm,
+    ) = _parse_sliver_filter(ctx.check_def.raw or {})
+    # Tiny artifacts and sub-minimum areas are both simply skipped, so one
+    # comparison against the larger floor covers them.
+    area_floor_mm2 = max(min_area_mm2, ignore_tiny_feature_area_mm2)
 
     copper_layers = queries.get_copper_layers(ctx.geometry)
     if not copper_layers:
@@ -153,41 +178,73 @@ def run_copper_sliver_width(ctx: CheckContext) -> CheckResult:
             violations=[viol],
         )
 
-    min_sliver: Optional[float] = None
-    worst_location: Optional[ViolationLocation] = None
+    # Running minimum over candidates; inf until the first one is seen, so the
+    # per-candidate test is a single float compare.
+    min_sliver = math.inf
+    # Only the final minimum is reported, so keep its location as plain
+    # scalars and build the ViolationLocation once, after the scan.
+    worst_layer = ""
+    worst_x = worst_y = 0.0
+
+    poly_bounds = queries.get_or_build_polygon_bounds(ctx)
+    poly_areas = queries.get_or_build_polygon_bbox_areas(ctx)
+
+    layer_bounds = queries.get_or_build_layer_bounds(ctx)
 
     for layer in copper_layers:
-        for poly in layer.polygons:
-            b = poly.bounds()
-            width = max(b.max_x - b.min_x, 0.0)
-            height = max(b.max_y - b.min_y, 0.0)
-            if width <= 0.0 or height <= 0.0:
+        key = id(layer)
+        # Each polygon bbox lies inside the layer's: if even the layer box is
+        # too small or too short, no polygon on it can be a candidate.
+        lb = layer_bounds.get(key)
+        if lb is None:
+            continue
+        lw = lb.max_x - lb.min_x
+        lh = lb.max_y - lb.min_y
+        if lw * lh < area_floor_mm2 or (lw * lw + lh * lh) ** 0.5 < min_long_dim_mm:
+            continue
+        for poly, b, area in zip(layer.polygons, poly_bounds[key], poly_areas[key]):
+            if area < area_floor_mm2:
                 continue
-
-            area = width * height
-            if area < ignore_tiny_feature_area_mm2:
-                # extremely small artifact, ignore entirely
+            width = b.max_x - b.min_x
+            height = b.max_y - b.min_y
+            if width <= 0.0 or height <= 0.0:
                 continue
 
             short_dim_bbox = min(width, height)
             if short_dim_bbox <= 0.0:
                 continue
+            # The estimated width is clamped to the bbox short dimension, so a
+            # polygon already narrower than the candidate floor here can only
+            # fail the min_candidate_short_dim_mm filter later.
+            if short_dim_bbox < min_candidate_short_dim_mm:
+                continue
             bbox_diag = (width * width + height * height) ** 0.5
+            # Every vertex lies inside the bbox, so the longest extent can never
+            # exceed the bbox diagonal: a polygon whose diagonal is already too
+            # short cannot pass the length filter and skips the vertex work.
+            if bbox_diag < min_long_dim_mm:
+                continue
 
             # Use rotation-invariant width (area/length) and length for the
             # candidate filters, so a diagonal thin sliver (which has a
             # near-square bounding box) is not dropped before its true width is
             # ever measured.
             pts = _poly_vertices(poly)
+            poly_area = _shoelace_area(pts)
+            # The width estimate only shrinks, and the aspect ratio only grows,
+            # as the extent grows, and the extent is at most the bbox diagonal.
+            # Evaluated there they bound the true values, so a polygon that
+            # fails even at the diagonal is rejected before the O(n^2) extent.
+            width_at_diag = _estimate_width_mm(poly_area, short_dim_bbox, bbox_diag)
+            if width_at_diag > max_short_dim_mm or bbox_diag / width_at_diag < min_aspect_ratio:
+                continue
             extent = _longest_extent(pts, bbox_diag)
-            sliver_width = _estimate_width_mm(poly, short_dim_bbox, bbox_diag)
+            sliver_width = _estimate_width_mm(poly_area, short_dim_bbox, extent)
             if extent <= 0.0 or sliver_width <= 0.0:
                 continue
             aspect_ratio = extent / sliver_width
 
             # sliver candidate filters (rotation invariant)
-            if area < min_area_mm2:
-                continue
             if aspect_ratio < min_aspect_ratio:
                 continue
             if extent < min_long_dim_mm:
@@ -196,18 +253,13 @@ def run_copper_sliver_width(ctx: CheckContext) -> CheckResult:
                 continue
             if sliver_width > max_short_dim_mm:
                 continue
-            if min_sliver is None or sliver_width < min_sliver:
+            if sliver_width < min_sliver:
                 min_sliver = sliver_width
-                cx = 0.5 * (b.min_x + b.max_x)
-                cy = 0.5 * (b.min_y + b.max_y)
-                worst_location = ViolationLocation(
-                    layer=layer.logical_layer,
-                    x_mm=cx,
-                    y_mm=cy,
-                    notes="Narrow copper region (sliver) based on polygon bounding box.",
-                )
+                worst_layer = layer.logical_layer
+                worst_x = 0.5 * (b.min_x + b.max_x)
+                worst_y = 0.5 * (b.min_y + b.max_y)
 
-    if min_sliver is None:
+    if min_sliver == math.inf:
         viol = Violation(
             severity="info",
             message="No elongated copper regions found that match sliver criteria.",
@@ -264,7 +316,12 @@ def run_copper_sliver_width(ctx: CheckContext) -> CheckResult:
             Violation(
                 severity=severity,
                 message=msg,
-                location=worst_location,
+                location=ViolationLocation(
+                    layer=worst_layer,
+                    x_mm=worst_x,
+                    y_mm=worst_y,
+                    notes="Narrow copper region (sliver) based on polygon bounding box.",
+                ),
             )
         )
 
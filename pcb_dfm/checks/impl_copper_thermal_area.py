@@ -4,40 +4,16 @@ from typing import List, Optional, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
+from ..geometry import queries
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
 
 
-def _poly_area_mm2(poly) -> float:
-    """
-    Best-effort polygon area in mm^2, consistent with other checks.
-    """
-    if hasattr(poly, "area_mm2"):
-        return float(poly.area_mm2)
-
-    if hasattr(poly, "area"):
-        try:
-            return float(poly.area())
-        except TypeError:
-            try:
-                return float(poly.area)
-            except TypeError:
-                pass
-
-    # Fallback: bbox-based approximation
-    b = poly.bounds()
-    try:
-        width = float(b.max_x - b.min_x)
-        height = float(b.max_y - b.min_y)
-        return max(0.0, width * height)
-    except Exception:
-        return 0.0
-
-
-def _get_board_bbox_mm(geom) -> Optional[Tuple[float, float, float, float]]:
+def _get_board_bbox_mm(ctx: CheckContext) -> Optional[Tuple[float, float, float, float]]:
     """
     Return (min_x, min_y, max_x, max_y) of the board outline in mm, in the same
     coordinate system as copper polygons. Falls back to 'board' dims if needed.
     """
+    geom = ctx.geometry
     board = getattr(geom, "board", None)
     if board is not None:
         w = getattr(board, "width_mm", None)
@@ -50,33 +26,21 @@ def _get_board_bbox_mm(geom) -> Optional[Tuple[float, float, float, float]]:
             min_y = float(oy)
             return (min_x, min_y, min_x + float(w), min_y + float(h))
 
-    # Fallback: outline polygons bounding box
-    min_x = None
-    max_x = None
-    min_y = None
-    max_y = None
-
-    for layer in getattr(geom, "layers", []):
-        layer_type = getattr(layer, "layer_type", getattr(layer, "type", None))
-        if layer_type not in ("outline", "board_outline"):
+    # Fallback: outline polygons bounding box, from the cached per-layer bounds.
+    layer_bounds = queries.get_or_build_layer_bounds(ctx)
+    outline: Optional[Tuple[float, float, float, float]] = None
+    outline_layers = geom.get_layers_by_type("outline") + geom.get_layers_by_type("board_outline")
+    for layer in outline_layers:
+        lb = layer_bounds.get(id(layer))
+        if lb is None:
             continue
-        for poly in getattr(layer, "polygons", []):
-            b = poly.bounds()
-            xs = [float(b.min_x), float(b.max_x)]
-            ys = [float(b.min_y), float(b.max_y)]
-            if min_x is None:
-                min_x, max_x = min(xs), max(xs)
-                min_y, max_y = min(ys), max(ys)
-            else:
-                min_x = min(min_x, *xs)
-                max_x = max(max_x, *xs)
-                min_y = min(min_y, *ys)
-                max_y = max(max_y, *ys)
-
-    if min_x is None or max_x is None or min_y is None or max_y is None:
-        return None
+        if outline is None:
+            outline = (lb.min_x, lb.min_y, lb.max_x, lb.max_y)
+        else:
+            outline = (min(outline[0], lb.min_x), min(outline[1], lb.min_y),
+                       max(outline[2], lb.max_x), max(outline[3], lb.max_y))
 
-    return (min_x, min_y, max_x, max_y)
+    return outline
 
 
 @register_check("copper_thermal_area")
@@ -108,7 +72,7 @@ def run_copper_thermal_area(ctx: CheckContext) -> CheckResult:
 
     geom = ctx.geometry
 
-    bbox = _get_board_bbox_mm(geom)
+    bbox = _get_board_bbox_mm(ctx)
     if bbox is None:
         viol = Violation(
             severity="info",
@@ -144,25 +108,22 @@ def run_copper_thermal_area(ctx: CheckContext) -> CheckResult:
 
     best_pct = 0.0
     best_layer_name: Optional[str] = None
+    layer_areas = queries.get_or_build_layer_bbox_area(ctx)
+    copper_layers = queries.get_copper_layers(geom)
 
-    for layer in getattr(geom, "layers", []):
-        layer_type = getattr(layer, "layer_type", getattr(layer, "type", None))
-        if layer_type != "copper":
-            continue
-
-        logical = getattr(layer, "logical_layer", getattr(layer, "name", None))
-
-        total_area = 0.0
-        for poly in getattr(layer, "polygons", []):
-            total_area += _poly_area_mm2(poly)
-
+    def _coverage_pct(layer) -> float:
         # Clamp to board area so we don't exceed 100% due to overlaps, etc.
-        total_area = min(total_area, board_area_mm2)
-        coverage_pct = (total_area / board_area_mm2) * 100.0
-
-        if coverage_pct > best_pct:
+        total_area = min(layer_areas.get(id(layer), 0.0), board_area_mm2)
+        return (total_area / board_area_mm2) * 100.0
+
+    if copper_layers:
+        # max() keeps the first of equally covered layers, as the previous
+        # strictly-greater scan did; zero coverage still means no copper.
+        best = max(copper_layers, key=_coverage_pct)
+        coverage_pct = _coverage_pct(best)
+        if coverage_pct > 0.0:
             best_pct = coverage_pct
-            best_layer_name = logical
+            best_layer_name = best.logical_layer
 
     # No copper at all
     if best_layer_name is None:
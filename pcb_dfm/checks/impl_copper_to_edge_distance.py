@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 import math
-from typing import List, Optional
+from operator import itemgetter
+from typing import List, Optional, Set, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
@@ -12,12 +14,44 @@ from ..geometry.gerber_backend import outline_contours_mm
 from ..geometry.polygon_index import PolygonIndex
 from ..geometry.primitives import Bounds, Point2D, Polygon
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
-from .impl_min_annular_ring import _min_distance_to_polygon_edges, _point_in_polygon
-from .impl_solder_mask_expansion import _distance_point_to_segment
+from .impl_min_annular_ring import _point_in_polygon
 
 MAX_REPORTED_VIOLATIONS = 100
 
 
+def _min_sq_points_to_segments(points, segments) -> float:
+    """Smallest *squared* distance from any of ``points`` to any segment.
+
+    The point-to-segment math of ``_distance_point_to_segment`` inlined into
+    one loop nest, without the per-pair call and square root. Each squared
+    distance is the exact radicand that function takes the root of, so the
+    root of the minimum is bit-identical to the minimum of the roots.
+    """
+    best = math.inf
+    for (x1, y1, x2, y2) in segments:
+        dx = x2 - x1
+        dy = y2 - y1
+        if abs(dx) < 1e-10 and abs(dy) < 1e-10:
+            # Degenerate segment: distance to its start point.
+            for (px, py) in points:
+                dd = (px - x1) ** 2 + (py - y1) ** 2
+                if dd < best:
+                    best = dd
+            continue
+        len2 = dx * dx + dy * dy
+        for (px, py) in points:
+            t = ((px - x1) * dx + (py - y1) * dy) / len2
+            if t < 0:
+                dd = (px - x1) ** 2 + (py - y1) ** 2
+            elif t > 1:
+                dd = (px - x2) ** 2 + (py - y2) ** 2
+            else:
+                dd = (px - (x1 + t * dx)) ** 2 + (py - (y1 + t * dy)) ** 2
+            if dd < best:
+                best = dd
+    return best
+
+
 def _min_dist_polygon_to_segments(verts, segments) -> float:
     """Exact minimum distance from a polygon (``verts``) to a set of line
     segments, each ``(x1, y1, x2, y2)``.
@@ -27,21 +61,17 @@ def _min_dist_polygon_to_segments(verts, segments) -> float:
     against the polygon's edges. Used so a copper polygon is measured only
     against the *nearby* slice of the (possibly 1000+ vertex) board outline.
     """
-    best = math.inf
-    for v in verts:
-        vx, vy = v.x, v.y
-        for (x1, y1, x2, y2) in segments:
-            dd = _distance_point_to_segment(vx, vy, x1, y1, x2, y2)
-            if dd < best:
-                best = dd
-    for (x1, y1, x2, y2) in segments:
-        d1 = _min_distance_to_polygon_edges(x1, y1, verts)
-        if d1 < best:
-            best = d1
-        d2 = _min_distance_to_polygon_edges(x2, y2, verts)
+    pts = [(v.x, v.y) for v in verts]
+    best = _min_sq_points_to_segments(pts, segments)
+    n = len(pts)
+    if n >= 3:
+        ends = [(x1, y1) for (x1, y1, _, _) in segments]
+        ends += [(x2, y2) for (_, _, x2, y2) in segments]
+        edges = [(*pts[i], *pts[(i + 1) % n]) for i in range(n)]
+        d2 = _min_sq_points_to_segments(ends, edges)
         if d2 < best:
             best = d2
-    return best
+    return math.sqrt(best)
 
 
 def _poly_area(poly: Polygon) -> float:
@@ -69,7 +99,7 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
       - warning: absolute_min <= min < recommended_min
       - fail: min < absolute_min
     """
-    board_bounds = queries.get_board_bounds(ctx.geometry)
+    board_bounds = queries.get_or_build_board_bounds(ctx)
     copper_layers = queries.get_copper_layers(ctx.geometry)
 
     metric_cfg = ctx.check_def.metric or {}
@@ -79,6 +109,21 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
     recommended_min = float(limits.get("recommended_min", 0.25))
     absolute_min = float(limits.get("absolute_min", 0.15))
 
+    def _not_applicable(reason: str) -> CheckResult:
+        return CheckResult(
+            check_id=ctx.check_def.id,
+            name=ctx.check_def.name,
+            category_id=ctx.check_def.category_id,
+            status="not_applicable",
+            severity="info",  # Default value, will be overridden by finalize()
+            metric=MetricResult.geometry_mm(
+                measured_mm=None,
+                target_mm=recommended_min,
+                limit_low_mm=absolute_min,
+            ),
+            violations=[Violation(severity="info", message=reason, location=None)],
+        ).finalize()
+
     # The board edge is derived from CLOSED contours assembled out of the outline
     # layer's stroked segments (#18), not from the raw outline geometry. An
     # outline layer routinely also carries dimension lines, registration/plot
@@ -116,28 +161,15 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
             board_contour = max(edge_polys, key=lambda p: _poly_area(p))
 
     if board_bounds is None or not copper_layers or not edge_polys:
-        message = "No board outline or copper geometry available to compute copper to edge distance."
-        viol = Violation(
-            severity="info",
-            message=message,
-            location=None,
+        return _not_applicable(
+            "No board outline or copper geometry available to compute copper to edge distance."
         )
-        return CheckResult(
-            check_id=ctx.check_def.id,
-            name=ctx.check_def.name,
-            category_id=ctx.check_def.category_id,
-            status="not_applicable",
-            severity="info",  # Default value, will be overridden by finalize()
-            metric=MetricResult.geometry_mm(
-                measured_mm=None,
-                target_mm=recommended_min,
-                limit_low_mm=absolute_min,
-            ),
-            violations=[viol],
-        ).finalize()
 
     min_dist: Optional[float] = None
-    worst_location: Optional[ViolationLocation] = None
+    # Location of the running minimum as plain scalars; the ViolationLocation
+    # is only built if the report actually needs it.
+    worst_layer = ""
+    worst_x = worst_y = 0.0
 
     # (dist_mm, layer_name, x_mm, y_mm)
     offenders: List[tuple[float, str, float, float]] = []
@@ -167,22 +199,55 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
             edge_segments.append((a.x, a.y, b.x, b.y))
             seg_bounds.append(Bounds(min(a.x, b.x), min(a.y, b.y),
                                      max(a.x, b.x), max(a.y, b.y)))
-    seg_index = PolygonIndex.from_bounds(list(enumerate(seg_bounds)))
+    # Size the grid to the query radius, not to the segments. The automatic
+    # (median segment length) cell is tiny on a tessellated outline, so every
+    # copper query -- its bbox inflated by up to `cutoff` -- swept hundreds of
+    # empty cells; a plane-sized pour swept hundreds of thousands, and that
+    # sweep, not the distance math, was most of this check's runtime.
+    seg_index = PolygonIndex.from_bounds(list(enumerate(seg_bounds)), cell_size=cutoff)
+
+    # Every cell within one ring of a cell some segment touches. The query
+    # radius never exceeds `cutoff` (the cell size), so copper whose bbox sits
+    # in a single cell outside this set has no segment in range: one set lookup
+    # rejects it before the index query.
+    near_cells: Set[Tuple[int, int]] = set()
+    for sb in seg_bounds:
+        cx0, cy0 = seg_index.cell_of(sb.min_x, sb.min_y)
+        cx1, cy1 = seg_index.cell_of(sb.max_x, sb.max_y)
+        for cx in range(cx0 - 1, cx1 + 2):
+            for cy in range(cy0 - 1, cy1 + 2):
+                near_cells.add((cx, cy))
+
+    poly_bounds = queries.get_or_build_polygon_bounds(ctx)
+
+    layer_bounds = queries.get_or_build_layer_bounds(ctx)
+
+    # Bound once: the per-polygon loop below runs for every copper feature.
+    cell_of = seg_index.cell_of
+    query_bbox = seg_index.query_bbox
+    contour_verts = board_contour.vertices if board_contour is not None else None
 
     for layer in copper_layers:
-        for poly in layer.polygons:
-            pb = poly.bounds()
-            loc_x, loc_y = 0.5 * (pb.min_x + pb.max_x), 0.5 * (pb.min_y + pb.max_y)
-
-            # Copper outside the board boundary is not board copper -- it is the
-            # same plot/registration artwork that also appears on the outline
-            # layer (#18). Measuring it (against its own outline twin) is what
-            # produced the 0.000 mm false failure, so skip it.
-            if board_contour is not None and not _point_in_polygon(
-                loc_x, loc_y, board_contour.vertices
-            ):
+        layer_name = layer.logical_layer
+        lb = layer_bounds.get(id(layer))
+        if lb is None:
+            continue
+        if min_dist is not None:
+            # With a running minimum in hand, a layer whose whole extent has no
+            # outline segment within the current threshold can only produce the
+            # threshold itself for each polygon: never a new minimum, never an
+            # offender. Skip it with one query instead of one per polygon. Like
+            # the per-polygon skips below, this holds only while the threshold
+            # is not below the running minimum: an earlier exact distance can
+            # exceed `cutoff`, and then on-board copper here would still lower
+            # min_dist to the threshold.
+            layer_thr = min(cutoff, max(recommended_min, min_dist))
+            if layer_thr >= min_dist and not query_bbox(
+                    Bounds(lb.min_x - layer_thr, lb.min_y - layer_thr,
+                           lb.max_x + layer_thr, lb.max_y + layer_thr)):
                 continue
-
+        for poly, pb in zip(layer.polygons, poly_bounds[id(layer)]):
+            pmin_x, pmin_y, pmax_x, pmax_y = pb.min_x, pb.min_y, pb.max_x, pb.max_y
             # Exact polygon-to-polygon distance is only needed for copper that
             # could either be the new global minimum or an offender (within the
             # recommended clearance). The bbox gap is a lower bound on the true
@@ -194,56 +259,56 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
             # behaviour is never looser than before.
             exact_thr = min(cutoff, max(recommended_min, min_dist if min_dist is not None else cutoff))
 
+            if min_dist is not None and exact_thr >= min_dist:
+                cell = cell_of(pmin_x, pmin_y)
+                if cell not in near_cells and cell == cell_of(pmax_x, pmax_y):
+                    continue  # no segment in range; see the skip below
+
             # Query only outline segments whose bbox is within exact_thr of this
             # copper's bbox; compute the exact distance to that local slice.
-            q = Bounds(pb.min_x - exact_thr, pb.min_y - exact_thr,
-                       pb.max_x + exact_thr, pb.max_y + exact_thr)
-            near_ids = seg_index.query_bbox(q)
+            near_ids = query_bbox(
+                Bounds(pmin_x - exact_thr, pmin_y - exact_thr,
+                       pmax_x + exact_thr, pmax_y + exact_thr))
+            if not near_ids and min_dist is not None and exact_thr >= min_dist:
+                # No outline segment within exact_thr: this copper is farther
+                # than the threshold from every edge, so it can be neither the
+                # running minimum (exact_thr >= min_dist) nor an offender
+                # (exact_thr >= recommended_min). Whether it is even on the
+                # board no longer matters, so it skips the containment test.
+                continue
+
+            loc_x, loc_y = 0.5 * (pmin_x + pmax_x), 0.5 * (pmin_y + pmax_y)
+
+            # Copper outside the board boundary is not board copper -- it is the
+            # same plot/registration artwork that also appears on the outline
+            # layer (#18). Measuring it (against its own outline twin) is what
+            # produced the 0.000 mm false failure, so skip it.
+            if contour_verts is not None and not _point_in_polygon(
+                loc_x, loc_y, contour_verts
+            ):
+                continue
+
             if near_ids:
                 d = _min_dist_polygon_to_segments(
                     poly.vertices, [edge_segments[i] for i in near_ids]
                 )
             else:
-                # No outline segment within exact_thr: this copper is farther
-                # than the threshold from every edge, so it can be neither the
-                # running minimum (exact_thr >= min_dist) nor an offender
-                # (exact_thr >= recommended_min). Its exact value is irrelevant.
                 d = exact_thr
 
             if min_dist is None or d < min_dist:
                 min_dist = d
-                worst_location = ViolationLocation(
-                    layer=layer.logical_layer,
-                    x_mm=loc_x,
-                    y_mm=loc_y,
-                    notes="Closest copper to board edge",
-                )
+                worst_layer = layer_name
+                worst_x, worst_y = loc_x, loc_y
 
             # Track any copper feature that violates the recommended minimum
             if d < recommended_min:
-                offenders.append((d, layer.logical_layer, loc_x, loc_y))
+                offenders.append((d, layer_name, loc_x, loc_y))
 
     # If somehow no polygons, nothing to measure
     if min_dist is None:
-        message = "No copper geometry available to compute copper to edge distance."
-        viol = Violation(
-            severity="info",
-            message=message,
-            location=None,
+        return _not_applicable(
+            "No copper geometry available to compute copper to edge distance."
         )
-        return CheckResult(
-            check_id=ctx.check_def.id,
-            name=ctx.check_def.name,
-            category_id=ctx.check_def.category_id,
-            status="not_applicable",
-            severity="info",  # Default value, will be overridden by finalize()
-            metric=MetricResult.geometry_mm(
-                measured_mm=None,
-                target_mm=recommended_min,
-                limit_low_mm=absolute_min,
-            ),
-            violations=[viol],
-        ).finalize()
 
     # Determine status only (severity handled by finalize)
     if min_dist < absolute_min:
@@ -258,12 +323,21 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
         # Hard clearance violations are errors; softer ones are warnings.
         severity = "error" if status == "fail" else "warning"
 
-        offenders_sorted = sorted(offenders, key=lambda t: t[0])
-        if offenders_sorted:
-            for dist_mm, layer_name, x_mm, y_mm in offenders_sorted[:MAX_REPORTED_VIOLATIONS]:
+        # Only the closest MAX_REPORTED_VIOLATIONS are reported, so select them
+        # with a bounded heap instead of sorting every offender. nsmallest is
+        # stable, so equal distances keep their scan order as before.
+        worst_offenders = heapq.nsmallest(
+            MAX_REPORTED_VIOLATIONS, offenders, key=itemgetter(0))
+        if worst_offenders:
+            # Only the distance and layer vary per offender; the limits part of
+            # the message is formatted once.
+            limits_tail = (
+                f"below recommended {recommended_min:.3f} mm (absolute minimum {absolute_min:.3f} mm)."
+            )
+            for dist_mm, layer_name, x_mm, y_mm in worst_offenders:
                 message = (
                     f"Copper feature is {dist_mm:.3f} mm from board edge on layer {layer_name}, "
-                    f"below recommended {recommended_min:.3f} mm (absolute minimum {absolute_min:.3f} mm)."
+                    + limits_tail
                 )
                 violations.append(
                     Violation(
@@ -286,7 +360,12 @@ def run_copper_to_edge_distance(ctx: CheckContext) -> CheckResult:
                 Violation(
                     severity=severity,
                     message=message,
-                    location=worst_location,
+                    location=ViolationLocation(
+                        layer=worst_layer,
+                        x_mm=worst_x,
+                        y_mm=worst_y,
+                        notes="Closest copper to board edge",
+                    ),
                 )
             )
 
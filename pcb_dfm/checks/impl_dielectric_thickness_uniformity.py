@@ -4,6 +4,19 @@ from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
 from ..results import CheckResult, MetricResult, Violation
 
+# The not-applicable result carries the same metric and message every time,
+# so they are built once as templates and copied into each result; handing
+# out the shared objects would let one caller's edits leak into later runs.
+_NO_STACKUP_METRIC = MetricResult(kind="distance", units="um", measured_value=None)
+_NO_STACKUP_VIOLATION = Violation(
+    message=(
+        "Dielectric thickness uniformity cannot be evaluated from "
+        "Gerbers alone. Provide a design-data sidecar with "
+        "'stackup.dielectric_layers_mm' (>= 2 layers) to enable it."
+    ),
+    severity="info",
+)
+
 
 def _nested_max(metric_cfg: dict, key: str, default: float) -> float:
     node = metric_cfg.get(key)
@@ -42,15 +55,8 @@ def run_dielectric_thickness_uniformity(ctx: CheckContext) -> CheckResult:
             status="not_applicable",
             severity="info",
             score=None,
-            metric=MetricResult(kind="distance", units="um", measured_value=None),
-            violations=[Violation(
-                message=(
-                    "Dielectric thickness uniformity cannot be evaluated from "
-                    "Gerbers alone. Provide a design-data sidecar with "
-                    "'stackup.dielectric_layers_mm' (>= 2 layers) to enable it."
-                ),
-                severity="info",
-            )],
+            metric=_NO_STACKUP_METRIC.model_copy(),
+            violations=[_NO_STACKUP_VIOLATION.model_copy()],
         )
 
     mean = sum(usable) / len(usable)
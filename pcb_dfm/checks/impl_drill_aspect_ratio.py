@@ -59,16 +59,7 @@ def run_drill_aspect_ratio(ctx: CheckContext) -> CheckResult:
     # thicknesses); fall back to 1.6 mm only when no stackup is supplied.
     board_thickness_mm = _resolve_board_thickness_mm(ctx)
 
-    drill_files: List[GerberFileInfo] = [
-        f for f in ctx.ingest.files if f.layer_type == "drill"
-    ]
-
-    if not GERBONARA_AVAILABLE or not drill_files:
-        viol = Violation(
-            severity="warning",
-            message="No drill parser available or no drill files found to compute drill aspect ratio.",
-            location=None,
-        )
+    def _no_drill_data(reason: str) -> CheckResult:
         return CheckResult(
             check_id=ctx.check_def.id,
             name=ctx.check_def.name,
@@ -81,35 +72,32 @@ def run_drill_aspect_ratio(ctx: CheckContext) -> CheckResult:
                 target=recommended_max,
                 limit_high=absolute_max,
             ),
-            violations=[viol],
+            violations=[Violation(severity="warning", message=reason, location=None)],
         ).finalize()
 
-    diameters_mm: List[float] = []
-    for info in drill_files:
-        diameters_mm.extend(_extract_tool_diameters_mm(info.path))
+    drill_files: List[GerberFileInfo] = [
+        f for f in ctx.ingest.files if f.layer_type == "drill"
+    ]
 
-    if not diameters_mm:
-        viol = Violation(
-            severity="warning",
-            message="No drill tools or hits found to compute drill aspect ratio.",
-            location=None,
+    if not GERBONARA_AVAILABLE or not drill_files:
+        return _no_drill_data(
+            "No drill parser available or no drill files found to compute drill aspect ratio."
+        )
+
+    # Only the smallest hole sets the aspect ratio. Each file's tool list comes
+    # back sorted, so its first entry is that file's minimum; the overall
+    # minimum is reduced straight from those, with no intermediate list.
+    min_d_mm = min(
+        (dias[0] for dias in (_extract_tool_diameters_mm(info.path) for info in drill_files)
+         if dias),
+        default=None,
+    )
+
+    if min_d_mm is None:
+        return _no_drill_data(
+            "No drill tools or hits found to compute drill aspect ratio."
         )
-        return CheckResult(
-            check_id=ctx.check_def.id,
-            name=ctx.check_def.name,
-            category_id=ctx.check_def.category_id,
-            status="warning",
-            severity="info",  # Default value, will be overridden by finalize()
-            score=50.0,
-            metric=MetricResult.dimensionless(
-                measured=None,
-                target=recommended_max,
-                limit_high=absolute_max,
-            ),
-            violations=[viol],
-        ).finalize()
 
-    min_d_mm = min(diameters_mm)
     aspect = board_thickness_mm / min_d_mm
 
     # Decide status only (severity handled by finalize)
@@ -129,8 +117,6 @@ def run_drill_aspect_ratio(ctx: CheckContext) -> CheckResult:
         span = absolute_max - recommended_max
         score = max(0.0, min(100.0, 100.0 * (absolute_max - aspect) / span))
 
-    margin_to_limit = float(absolute_max - aspect)
-
     violations: List[Violation] = []
     if status != "pass":
         msg = (
@@ -162,7 +148,7 @@ def run_drill_aspect_ratio(ctx: CheckContext) -> CheckResult:
 
 
 def _extract_tool_diameters_mm(path) -> List[float]:
-    """Drill tool diameters in mm, via the gerbonara parse backend (#3).
+    """Drill tool diameters in mm, ascending, via the gerbonara parse backend (#3).
 
     The pcb-tools path read tool diameters in the file's native unit and
     multiplied by 25.4 unconditionally, so mm-native drill files reported
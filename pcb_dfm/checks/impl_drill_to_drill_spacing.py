@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from math import floor, hypot, sqrt
+from math import floor, sqrt
 from typing import Dict, List, Optional, Tuple
 
 from ..engine.check_runner import register_check
@@ -11,27 +11,14 @@ from ..geometry.gerber_backend import excellon_hits_mm
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
 
 
-@dataclass
+@dataclass(slots=True)
 class DrillHole:
     x_mm: float
     y_mm: float
     diameter_mm: float
 
 
-def _cell_key(x: float, y: float, cell: float) -> Tuple[int, int]:
-    return (int(floor(x / cell)), int(floor(y / cell)))
-
-
-def _min_possible_center_dist_between_cells(dx_cells: int, dy_cells: int, cell: float) -> float:
-    """
-    Lower bound on distance between any two points located in two grid cells offset by (dx_cells, dy_cells).
-    """
-    dx = max(0, abs(dx_cells) - 1) * cell
-    dy = max(0, abs(dy_cells) - 1) * cell
-    return hypot(dx, dy)
-
-
-def _collect_drills(ctx: CheckContext) -> List[DrillHole]:
+def _build_drills(ctx: CheckContext) -> List[DrillHole]:
     """All drilled holes in mm, via the gerbonara parse backend (#3).
 
     Replaces the pcb-tools path, which called ``to_inch()`` then multiplied by
@@ -49,6 +36,19 @@ def _collect_drills(ctx: CheckContext) -> List[DrillHole]:
     return drills
 
 
+def _collect_drills(ctx: CheckContext) -> List[DrillHole]:
+    """
+    :func:`_build_drills` memoised in the context's geometry cache. The Excellon
+    parse itself is already cached per file; this shares the DrillHole list
+    between drill spacing, silkscreen clearance and wave-solder shadowing
+    instead of rebuilding it in each. Read-only.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_drills(ctx)
+    return cache.get_or_compute(cache.key("drills", "collect"), lambda: _build_drills(ctx))
+
+
 @register_check("drill_to_drill_spacing")
 def run_drill_to_drill_spacing(ctx: CheckContext) -> CheckResult:
     """
@@ -93,23 +93,27 @@ def run_drill_to_drill_spacing(ctx: CheckContext) -> CheckResult:
             violations=[viol],
         ).finalize()
 
-    min_spacing: Optional[float] = None
-    worst_location: Optional[ViolationLocation] = None
-
     # Build grid index of drills
     max_d = max(h.diameter_mm for h in drills)
     # cell size: big enough that "likely nearest" lives nearby, but not so big that bins explode
     cell = max(0.5, recommended_min + max_d)  # mm; 0.5mm floor keeps bins reasonable on tiny thresholds
 
+    # Coordinates and radii as parallel lists: the pair loop reads plain floats
+    # by index instead of three attributes off a DrillHole per pair, and the
+    # worst pair is kept as indices until the loop is done.
+    xs = [h.x_mm for h in drills]
+    ys = [h.y_mm for h in drills]
+    rs = [0.5 * h.diameter_mm for h in drills]
+
+    # Cell keys are computed column-wise over the coordinate lists rather than
+    # through a helper call per drill (math.floor already returns an int).
     grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
-    for idx, h in enumerate(drills):
-        grid[_cell_key(h.x_mm, h.y_mm, cell)].append(idx)
+    for idx, key in enumerate(zip([floor(x / cell) for x in xs], [floor(y / cell) for y in ys])):
+        grid[key].append(idx)
 
     min_spacing: Optional[float] = None
     worst_location: Optional[ViolationLocation] = None
 
-    n = len(drills)
-
     # Only NEARBY drills can violate spacing: any pair whose centre-to-centre
     # distance exceeds recommended_min + both radii is comfortably in spec, so we
     # ignore it. With the grid cell sized to that cutoff, each drill only needs
@@ -117,32 +121,50 @@ def run_drill_to_drill_spacing(ctx: CheckContext) -> CheckResult:
     # regardless of board size or how sparsely holes are placed. (A previous
     # expanding-ring search blew up to O(rings^3) for far-apart holes.)
     cutoff = cell  # cell == recommended_min + max_d (+ 0.5 floor); covers every violation
-    for i in range(n):
-        h1 = drills[i]
-        r1 = 0.5 * h1.diameter_mm
-        ci, cj = _cell_key(h1.x_mm, h1.y_mm, cell)
+    # Squared-distance prefilter: most candidates in the 3x3 block lie beyond
+    # the cutoff, and comparing dx^2 + dy^2 needs no sqrt. The bound is padded
+    # a hair so rounding can never drop a pair the exact test below would keep;
+    # sqrt is only taken for pairs that survive it.
+    cutoff_sq = cutoff * cutoff * (1.0 + 1e-9)
+
+    worst_i = worst_j = -1
+    # Walk the grid cell by cell: the 3x3 neighbourhood is gathered once per
+    # occupied cell (in the same cell order, each bucket ascending) and shared
+    # by every drill in it, rather than looked up again for each drill.
+    for (ci, cj), members in grid.items():
+        neighbours: List[int] = []
         for di in (-1, 0, 1):
             for dj in (-1, 0, 1):
-                for j in grid.get((ci + di, cj + dj), ()):
-                    if j <= i:
-                        continue
-                    h2 = drills[j]
-                    r2 = 0.5 * h2.diameter_mm
-                    center_dist = sqrt((h2.x_mm - h1.x_mm) ** 2 + (h2.y_mm - h1.y_mm) ** 2)
-                    if center_dist > cutoff:
-                        continue  # far apart -> not a spacing concern
-                    # spacing <= 0 means tangent/overlapping holes -- the MOST
-                    # severe drill defect. It is recorded (not skipped) so the
-                    # metric reflects the true minimum, including overlaps.
-                    spacing = center_dist - (r1 + r2)
-                    if min_spacing is None or spacing < min_spacing:
-                        min_spacing = spacing
-                        worst_location = ViolationLocation(
-                            layer="DrillPlated",
-                            x_mm=0.5 * (h1.x_mm + h2.x_mm),
-                            y_mm=0.5 * (h1.y_mm + h2.y_mm),
-                            notes="Minimum spacing between two plated drill holes.",
-                        )
+                neighbours.extend(grid.get((ci + di, cj + dj), ()))
+        for i in members:
+            x1, y1, r1 = xs[i], ys[i], rs[i]
+            for j in neighbours:
+                if j <= i:
+                    continue
+                dist_sq = (xs[j] - x1) ** 2 + (ys[j] - y1) ** 2
+                if dist_sq > cutoff_sq:
+                    continue
+                center_dist = sqrt(dist_sq)
+                if center_dist > cutoff:
+                    continue  # far apart -> not a spacing concern
+                # spacing <= 0 means tangent/overlapping holes -- the MOST
+                # severe drill defect. It is recorded (not skipped) so the
+                # metric reflects the true minimum, including overlaps.
+                spacing = center_dist - (r1 + rs[j])
+                # Ties go to the lowest-numbered first drill, as a scan in
+                # drill order would report (regular hole grids tie a lot).
+                if (min_spacing is None or spacing < min_spacing
+                        or (spacing == min_spacing and i < worst_i)):
+                    min_spacing = spacing
+                    worst_i, worst_j = i, j
+
+    if min_spacing is not None:
+        worst_location = ViolationLocation(
+            layer="DrillPlated",
+            x_mm=0.5 * (xs[worst_i] + xs[worst_j]),
+            y_mm=0.5 * (ys[worst_i] + ys[worst_j]),
+            notes="Minimum spacing between two plated drill holes.",
+        )
 
     if min_spacing is None:
         # No pair fell within the cutoff -> every drill is comfortably far from
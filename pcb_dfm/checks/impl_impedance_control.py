@@ -6,6 +6,20 @@ from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
 
+# Without stackup + controlled nets the result never varies beyond the check
+# definition's ids, so its metric and explanation are module templates; each
+# result gets its own copy so no caller can mutate another run's result.
+_NO_INPUTS_METRIC = MetricResult(kind="ratio", units="%", measured_value=None)
+_NO_INPUTS_VIOLATION = Violation(
+    message=(
+        "Impedance control cannot be validated from Gerber artwork "
+        "alone. Provide a design-data sidecar with 'stackup' (er, "
+        "dielectric_thickness_mm, copper_thickness_mm) and "
+        "'controlled_impedance' (width_mm, target_ohm) to enable it."
+    ),
+    severity="info",
+)
+
 
 def _nested_max(metric_cfg: dict, key: str, default: float) -> float:
     """Read metric["target"]["max"] / metric["limits"]["max"] defensively."""
@@ -121,16 +135,8 @@ def run_impedance_control(ctx: CheckContext) -> CheckResult:
             status="not_applicable",
             severity="info",
             score=None,
-            metric=MetricResult(kind="ratio", units="%", measured_value=None),
-            violations=[Violation(
-                message=(
-                    "Impedance control cannot be validated from Gerber artwork "
-                    "alone. Provide a design-data sidecar with 'stackup' (er, "
-                    "dielectric_thickness_mm, copper_thickness_mm) and "
-                    "'controlled_impedance' (width_mm, target_ohm) to enable it."
-                ),
-                severity="info",
-            )],
+            metric=_NO_INPUTS_METRIC.model_copy(),
+            violations=[_NO_INPUTS_VIOLATION.model_copy()],
         )
 
     violations = []
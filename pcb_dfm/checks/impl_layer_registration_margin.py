@@ -8,7 +8,7 @@ from ..geometry import queries
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
 from .impl_min_annular_ring import (
     _collect_drills_from_excellon,
-    _is_pad_like_polygon,
+    _is_pad_like_bounds,
     compute_min_annular_ring,
 )
 
@@ -73,10 +73,11 @@ def run_layer_registration_margin(ctx: CheckContext) -> CheckResult:
         ).finalize()
 
     min_drill_dia = min(d.diameter_mm for d in drills)
+    poly_bounds = queries.get_or_build_polygon_bounds(ctx)
     pad_candidates: List[tuple] = []
     for layer in copper_layers:
-        for poly in layer.polygons:
-            if _is_pad_like_polygon(poly, min_drill_dia, absolute_min):
+        for poly, b in zip(layer.polygons, poly_bounds[id(layer)]):
+            if _is_pad_like_bounds(b, min_drill_dia, absolute_min):
                 pad_candidates.append((poly, layer.logical_layer))
 
     if not pad_candidates:
@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
+from ..geometry import queries
 from ..geometry.gerber_backend import gerber_traces_mm
 from ..geometry.polygon_index import PolygonIndex
 from ..geometry.primitives import Bounds
@@ -14,6 +15,7 @@ from .impl_min_annular_ring import _point_in_polygon
 from .impl_min_trace_spacing import (
     Segment,
     _conductor_groups,
+    _segment_bounds,
     _segment_segment_distance_mm,
 )
 from .impl_min_trace_width import _MIN_MEANINGFUL_TRACE_MM
@@ -165,18 +167,6 @@ def _opening_to_segment_clearance(opening_poly, seg: Segment) -> float:
     return best - 0.5 * seg.width_mm
 
 
-def _seg_bounds(seg: Segment):
-    half = 0.5 * seg.width_mm
-
-    class _B:
-        min_x = min(seg.x1_mm, seg.x2_mm) - half
-        max_x = max(seg.x1_mm, seg.x2_mm) + half
-        min_y = min(seg.y1_mm, seg.y2_mm) - half
-        max_y = max(seg.y1_mm, seg.y2_mm) + half
-
-    return _B
-
-
 def _side_key(side) -> str:
     return str(side).lower() if side is not None else "unknown"
 
@@ -235,16 +225,13 @@ def run_mask_to_trace_clearance(ctx: CheckContext) -> CheckResult:
     openings_by_side: dict[str, List[_Feature]] = defaultdict(list)
     traces_by_side: dict[str, List[_Feature]] = defaultdict(list)
 
-    for layer in getattr(geom, "layers", []):
-        layer_type = getattr(layer, "layer_type", getattr(layer, "type", None))
-        side = getattr(layer, "side", None)
-        logical = getattr(layer, "logical_layer", getattr(layer, "name", None))
-
-        if layer_type == "mask":
-            for poly in getattr(layer, "polygons", []):
-                if _poly_area_mm2(poly) < mask_min_area_mm2:
-                    continue
-                openings_by_side[_side_key(side)].append(_Feature(side, logical, poly))
+    for layer in queries.get_mask_layers(geom):
+        side = layer.side
+        side_key = _side_key(side)
+        for poly in layer.polygons:
+            if _poly_area_mm2(poly) < mask_min_area_mm2:
+                continue
+            openings_by_side[side_key].append(_Feature(side, layer.logical_layer, poly))
 
     # Copper comes from the drawn segments, not the tessellated outlines: the
     # exact centerline + width lets us test overlap (and hence conductor
@@ -301,28 +288,25 @@ def run_mask_to_trace_clearance(ctx: CheckContext) -> CheckResult:
         if not segs:
             continue
 
-        groups = _conductor_groups(segs)
-        group_of = [groups.find(i) for i in range(len(segs))]
-        seg_bounds = [_seg_bounds(sg) for sg in segs]
+        seg_bounds = [_segment_bounds(sg) for sg in segs]
 
         # Index the segment bboxes so each opening only tests nearby segments,
         # not all of them. The two passes below were O(openings * segments) --
         # 1.4 M bbox comparisons on a real board, this check's dominant cost.
-        seg_index = PolygonIndex.from_bounds([
-            (i, Bounds(b.min_x, b.min_y, b.max_x, b.max_y))
-            for i, b in enumerate(seg_bounds)
-        ])
+        # The conductor grouping reuses the same index.
+        seg_index = PolygonIndex.from_bounds(list(enumerate(seg_bounds)))
+        groups = _conductor_groups(segs, seg_bounds, seg_index)
+        group_of = [groups.find(i) for i in range(len(segs))]
 
         for opening in openings:
             ob = opening.bounds
-            ob_bounds = Bounds(ob.min_x, ob.min_y, ob.max_x, ob.max_y)
 
             # Pass 1: which conductors does this opening sit on? Those are its
             # own pad and that pad's routing -- not neighbors. Overlap requires
             # the bounding boxes to overlap, so only segments whose bbox meets
             # the opening's can qualify -- exactly what the index returns.
             owning: set = set()
-            for i in seg_index.query_bbox(ob_bounds):
+            for i in seg_index.query_bbox(ob):
                 if _bbox_gap(opening.bounds, seg_bounds[i]) > 0.0:
                     continue
                 if _opening_to_segment_clearance(opening.poly, segs[i]) <= 0.0:
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
 from math import floor, sqrt
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
@@ -12,8 +11,13 @@ from ..geometry.gerber_backend import excellon_hits_mm
 from ..results import CheckResult, MetricResult, Violation, ViolationLocation
 from ._geometry_guard import implausible_extent_result
 
+# How far outside a polygon's bbox _point_in_polygon can still report a point
+# as inside: its on-edge test allows |cross| and the endpoint dot product up to
+# 1e-10, i.e. within ~1.5e-5 mm of the edge. Padded generously.
+_PIP_SLOP = 1e-4
 
-@dataclass
+
+@dataclass(slots=True)
 class DrillHole:
     x_mm: float
     y_mm: float
@@ -26,62 +30,30 @@ def _point_in_polygon(x: float, y: float, vertices: List) -> bool:
     if len(vertices) < 3:
         return False
 
+    # Walks the edges as (previous vertex, vertex) pairs starting from the
+    # closing edge, with _point_on_segment inlined: this is the hot helper of
+    # several checks, and the per-edge call plus modulo indexing cost more than
+    # the arithmetic. Edge order cannot change the answer (an on-edge hit
+    # returns True wherever it is met; otherwise only the parity counts), and
+    # each edge keeps its orientation, so the float math is the same.
     inside = False
-    n = len(vertices)
-    for i in range(n):
-        j = (i + 1) % n
-        xi, yi = vertices[i].x, vertices[i].y
-        xj, yj = vertices[j].x, vertices[j].y
+    last = vertices[-1]
+    xi, yi = last.x, last.y
+    for v in vertices:
+        xj, yj = v.x, v.y
 
         # Check if point is on an edge (considered inside)
-        if _point_on_segment(x, y, xi, yi, xj, yj):
+        cross = (y - yi) * (xj - xi) - (x - xi) * (yj - yi)
+        if not abs(cross) > 1e-10 and not (x - xi) * (x - xj) + (y - yi) * (y - yj) > 1e-10:
             return True
 
         # Ray-casting test
         if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
             inside = not inside
 
-    return inside
-
-
-def _point_on_segment(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> bool:
-    """Check if point (px, py) lies on line segment (x1,y1)-(x2,y2)."""
-    # Cross product to check collinearity
-    cross = (py - y1) * (x2 - x1) - (px - x1) * (y2 - y1)
-    if abs(cross) > 1e-10:  # Not collinear
-        return False
-
-    # Check if point is within segment bounds
-    dot = (px - x1) * (px - x2) + (py - y1) * (py - y2)
-    if dot > 1e-10:  # Outside segment bounds
-        return False
-
-    return True
-
-
-def _distance_point_to_segment(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
-    """Calculate minimum distance from point to line segment."""
-    dx = x2 - x1
-    dy = y2 - y1
+        xi, yi = xj, yj
 
-    if abs(dx) < 1e-10 and abs(dy) < 1e-10:
-        # Segment is a point
-        return sqrt((px - x1)**2 + (py - y1)**2)
-
-    # Parameter t determines closest point on infinite line
-    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-
-    if t < 0:
-        # Closest point is segment start
-        return sqrt((px - x1)**2 + (py - y1)**2)
-    elif t > 1:
-        # Closest point is segment end
-        return sqrt((px - x2)**2 + (py - y2)**2)
-    else:
-        # Closest point is interior to segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-        return sqrt((px - closest_x)**2 + (py - closest_y)**2)
+    return inside
 
 
 def _min_distance_to_polygon_edges(x: float, y: float, vertices: List) -> float:
@@ -89,23 +61,83 @@ def _min_distance_to_polygon_edges(x: float, y: float, vertices: List) -> float:
     if len(vertices) < 3:
         return float('inf')
 
-    min_dist = float('inf')
-    n = len(vertices)
-
-    for i in range(n):
-        j = (i + 1) % n
-        x1, y1 = vertices[i].x, vertices[i].y
-        x2, y2 = vertices[j].x, vertices[j].y
-
-        dist = _distance_point_to_segment(x, y, x1, y1, x2, y2)
-        min_dist = min(min_dist, dist)
-
-    return min_dist
-
+    # Same edge walk as _point_in_polygon, with the point-to-segment distance
+    # inlined term for term (the minimum does not depend on edge order). The
+    # minimum is kept squared and rooted once: sqrt is monotone and correctly
+    # rounded, so sqrt(min(d2)) is exactly min(sqrt(d2)).
+    min_dist_sq = float('inf')
+    last = vertices[-1]
+    x1, y1 = last.x, last.y
+    for v in vertices:
+        x2, y2 = v.x, v.y
+        dx = x2 - x1
+        dy = y2 - y1
+
+        if abs(dx) < 1e-10 and abs(dy) < 1e-10:
+            dist_sq = (x - x1)**2 + (y - y1)**2
+        else:
+            t = ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)
+            if t < 0:
+                dist_sq = (x - x1)**2 + (y - y1)**2
+            elif t > 1:
+                dist_sq = (x - x2)**2 + (y - y2)**2
+            else:
+                dist_sq = (x - (x1 + t * dx))**2 + (y - (y1 + t * dy))**2
+        if dist_sq < min_dist_sq:
+            min_dist_sq = dist_sq
+
+        x1, y1 = x2, y2
+
+    return sqrt(min_dist_sq)
+
+
+def _point_in_polygon_with_edge_distance(x: float, y: float, vertices: List) -> Tuple[bool, float]:
+    """``(_point_in_polygon(...), _min_distance_to_polygon_edges(...))`` from
+    one walk over the edges instead of two.
+
+    Worth it only where the point is usually inside (the annular-ring loop
+    rejects by bbox first); the distance work is wasted on a miss.
+    """
+    if len(vertices) < 3:
+        return False, float('inf')
 
-def _is_pad_like_polygon(poly, drill_diameter_mm: float, absolute_min: float) -> bool:
-    """Filter out non-pad copper polygons (1A)."""
-    b = poly.bounds()
+    inside = False
+    on_edge = False
+    min_dist_sq = float('inf')  # rooted once at the end, as above
+    last = vertices[-1]
+    x1, y1 = last.x, last.y
+    for v in vertices:
+        x2, y2 = v.x, v.y
+        dx = x2 - x1
+        dy = y2 - y1
+
+        if not on_edge:
+            cross = (y - y1) * dx - (x - x1) * dy
+            if not abs(cross) > 1e-10 and not (x - x1) * (x - x2) + (y - y1) * (y - y2) > 1e-10:
+                on_edge = True
+            elif ((y1 > y) != (y2 > y)) and (x < dx * (y - y1) / dy + x1):
+                inside = not inside
+
+        if abs(dx) < 1e-10 and abs(dy) < 1e-10:
+            dist_sq = (x - x1)**2 + (y - y1)**2
+        else:
+            t = ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)
+            if t < 0:
+                dist_sq = (x - x1)**2 + (y - y1)**2
+            elif t > 1:
+                dist_sq = (x - x2)**2 + (y - y2)**2
+            else:
+                dist_sq = (x - (x1 + t * dx))**2 + (y - (y1 + t * dy))**2
+        if dist_sq < min_dist_sq:
+            min_dist_sq = dist_sq
+
+        x1, y1 = x2, y2
+
+    return on_edge or inside, sqrt(min_dist_sq)
+
+
+def _is_pad_like_bounds(b, drill_diameter_mm: float, absolute_min: float) -> bool:
+    """Filter out non-pad copper polygons (1A), judged from their bbox."""
     if b is None:
         return False
 
@@ -134,7 +166,7 @@ def _is_pad_like_polygon(poly, drill_diameter_mm: float, absolute_min: float) ->
     return True
 
 
-def _collect_drills_from_excellon(ctx: CheckContext) -> List[DrillHole]:
+def _build_drills_from_excellon(ctx: CheckContext) -> List[DrillHole]:
     """Plated drills in mm, via the gerbonara parse backend (#3).
 
     Replaces hand-rolled Excellon unit detection that mis-handled mm-native
@@ -156,6 +188,19 @@ def _collect_drills_from_excellon(ctx: CheckContext) -> List[DrillHole]:
     return drills
 
 
+def _collect_drills_from_excellon(ctx: CheckContext) -> List[DrillHole]:
+    """
+    :func:`_build_drills_from_excellon` memoised in the context's geometry
+    cache, shared by min_annular_ring and layer_registration_margin. Read-only.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_drills_from_excellon(ctx)
+    return cache.get_or_compute(
+        cache.key("drills", "plated_excellon"), lambda: _build_drills_from_excellon(ctx)
+    )
+
+
 def compute_min_annular_ring(drills, pad_candidates):
     """Thinnest annular ring over all holes, as ``(ring_mm, x_mm, y_mm, layer)``.
 
@@ -183,33 +228,67 @@ def compute_min_annular_ring(drills, pad_candidates):
         return None
 
     cell = max(0.5, max(d.diameter_mm for d in drills))
-    grid = defaultdict(list)
+    # Each pad is registered in every cell its bbox touches (padded by _PIP_SLOP
+    # for the on-edge tolerance of _point_in_polygon), so any pad that can
+    # contain a hole is already listed in the hole's own cell -- the 3x3 block
+    # around it only re-offered the same pads, or pads that cannot contain it.
+    # Only cells holding a hole are ever looked up, so only those get a bucket:
+    # most pad-like copper (SMD pads) lands nowhere near a drill and is never
+    # stored at all.
+    hole_cells = [(floor(h.x_mm / cell), floor(h.y_mm / cell)) for h in drills]
+    grid: Dict[Tuple[int, int], List[int]] = {key: [] for key in hole_cells}
+    # Padded bboxes of the stored pads: a hole outside one cannot be inside the
+    # pad (even by the on-edge tolerance), so it is rejected before any edge walk.
+    boxes: Dict[int, Tuple[float, float, float, float]] = {}
     for idx, (poly, _layer_name) in enumerate(pad_candidates):
         b = poly.bounds()
-        for iy in range(int(floor(b.min_y / cell)), int(floor(b.max_y / cell)) + 1):
-            for ix in range(int(floor(b.min_x / cell)), int(floor(b.max_x / cell)) + 1):
-                grid[(ix, iy)].append(idx)
+        bx0, by0 = b.min_x - _PIP_SLOP, b.min_y - _PIP_SLOP
+        bx1, by1 = b.max_x + _PIP_SLOP, b.max_y + _PIP_SLOP
+        ix0 = floor(bx0 / cell)
+        ix1 = floor(bx1 / cell)
+        for iy in range(floor(by0 / cell), floor(by1 / cell) + 1):
+            for ix in range(ix0, ix1 + 1):
+                bucket = grid.get((ix, iy))
+                if bucket is not None:
+                    bucket.append(idx)
+                    boxes[idx] = (bx0, by0, bx1, by1)
+
+    def _scan_order(idx: int, ci: int, cj: int) -> tuple:
+        # Where the former 3x3 scan (x-offset outer, y-offset inner, pads in
+        # index order per cell, each pad from its lowest unpadded cell) first
+        # met this pad: equal rings keep the layer that scan reported.
+        b = pad_candidates[idx][0].bounds()
+        return (max(-1, floor(b.min_x / cell) - ci), max(-1, floor(b.min_y / cell) - cj), idx)
 
     best: Optional[tuple] = None
-    for hole in drills:
+    for hole, (ci, cj) in zip(drills, hole_cells):
         r_drill = hole.diameter_mm * 0.5
-        ci = int(floor(hole.x_mm / cell))
-        cj = int(floor(hole.y_mm / cell))
 
         hole_ring: Optional[float] = None
         hole_layer: Optional[str] = None
-        for di in (-1, 0, 1):
-            for dj in (-1, 0, 1):
-                for idx in grid.get((ci + di, cj + dj), []):
-                    poly, layer_name = pad_candidates[idx]
-                    if not _point_in_polygon(hole.x_mm, hole.y_mm, poly.vertices):
-                        continue
-                    ring = _min_distance_to_polygon_edges(hole.x_mm, hole.y_mm, poly.vertices) - r_drill
-                    if ring < 0.0:
-                        ring = 0.0
-                    if hole_ring is None or ring > hole_ring:
-                        hole_ring = ring
-                        hole_layer = layer_name
+        hole_idx = -1
+        for idx in grid.get((ci, cj), ()):
+            bx0, by0, bx1, by1 = boxes[idx]
+            if hole.x_mm < bx0 or hole.x_mm > bx1 or hole.y_mm < by0 or hole.y_mm > by1:
+                continue
+            poly, layer_name = pad_candidates[idx]
+            inside, edge_dist = _point_in_polygon_with_edge_distance(hole.x_mm, hole.y_mm, poly.vertices)
+            if not inside:
+                continue
+            ring = edge_dist - r_drill
+            if ring < 0.0:
+                ring = 0.0
+            if (hole_ring is None or ring > hole_ring
+                    or (ring == hole_ring
+                        and _scan_order(idx, ci, cj) < _scan_order(hole_idx, ci, cj))):
+                hole_ring = ring
+                hole_layer = layer_name
+                hole_idx = idx
+                # A hole's ring is a max over its pads, so once it reaches the
+                # thinnest ring found so far it can no longer lower it (a tie
+                # does not replace): the rest of its pads cannot matter.
+                if best is not None and hole_ring >= best[0]:
+                    break
 
         if hole_ring is None:
             continue  # hole sits in no pad-like copper on any layer
@@ -276,13 +355,15 @@ def run_min_annular_ring(ctx: CheckContext) -> CheckResult:
     min_ring: Optional[float] = None
     worst_location: Optional[ViolationLocation] = None
 
-    # 1A) Filter copper polygons to pad-like shapes only
+    # 1A) Filter copper polygons to pad-like shapes only, sized against the
+    # smallest drill (conservative approach) -- found once, not per polygon.
+    min_drill_dia = min(d.diameter_mm for d in drills)
+    # Bboxes come from the run-wide cache rather than a fresh Bounds per polygon.
+    poly_bounds = queries.get_or_build_polygon_bounds(ctx)
     pad_candidates = []
     for layer in copper_layers:
-        for poly in layer.polygons:
-            # Use the smallest drill diameter for filtering (conservative approach)
-            min_drill_dia = min(d.diameter_mm for d in drills)
-            if _is_pad_like_polygon(poly, min_drill_dia, absolute_min):
+        for poly, b in zip(layer.polygons, poly_bounds[id(layer)]):
+            if _is_pad_like_bounds(b, min_drill_dia, absolute_min):
                 pad_candidates.append((poly, layer.logical_layer))
 
     if not pad_candidates:
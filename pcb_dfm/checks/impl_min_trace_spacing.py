@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import List, Optional, Tuple
 
 from ..engine.check_runner import register_check
@@ -35,7 +37,18 @@ class _DisjointSet:
             self._parent[rb] = ra
 
 
-def _conductor_groups(segs: List["Segment"]) -> _DisjointSet:
+def _segment_bounds(sg: "Segment") -> Bounds:
+    """Bounding box of a segment's copper: its endpoints inflated by half-width."""
+    hw = 0.5 * sg.width_mm
+    return Bounds(min(sg.x1_mm, sg.x2_mm) - hw, min(sg.y1_mm, sg.y2_mm) - hw,
+                  max(sg.x1_mm, sg.x2_mm) + hw, max(sg.y1_mm, sg.y2_mm) + hw)
+
+
+def _conductor_groups(
+    segs: List["Segment"],
+    seg_bounds: Optional[List[Bounds]] = None,
+    index: Optional[PolygonIndex] = None,
+) -> _DisjointSet:
     """Group segments into physically connected conductors.
 
     Copper that overlaps IS one conductor -- it is the same net by definition,
@@ -48,6 +61,10 @@ def _conductor_groups(segs: List["Segment"]) -> _DisjointSet:
 
     Segments carry an exact width, so segment-to-segment distance is exact and
     the connectivity test needs no tolerance at all: overlap means <= 0.
+
+    Callers that index the segments themselves pass their ``_segment_bounds``
+    list and the PolygonIndex over it, so the layer is indexed once rather than
+    once here and again for their own queries.
     """
     ds = _DisjointSet(len(segs))
     # Index segment bounding boxes (endpoints inflated by half-width) so each
@@ -55,14 +72,12 @@ def _conductor_groups(segs: List["Segment"]) -> _DisjointSet:
     # loop is O(n^2) and a real layer runs to a couple of thousand segments
     # (~4M pairs), which dominated this check's runtime; two segments can only
     # touch if their bboxes do, so the index is exact here, not just a heuristic.
-    def _seg_bounds(sg: "Segment") -> Bounds:
-        hw = 0.5 * sg.width_mm
-        return Bounds(min(sg.x1_mm, sg.x2_mm) - hw, min(sg.y1_mm, sg.y2_mm) - hw,
-                      max(sg.x1_mm, sg.x2_mm) + hw, max(sg.y1_mm, sg.y2_mm) + hw)
-
-    index = PolygonIndex.from_bounds([(i, _seg_bounds(sg)) for i, sg in enumerate(segs)])
+    if seg_bounds is None:
+        seg_bounds = [_segment_bounds(sg) for sg in segs]
+    if index is None:
+        index = PolygonIndex.from_bounds(list(enumerate(seg_bounds)))
     for i, s1 in enumerate(segs):
-        for j in index.query_bbox(_seg_bounds(s1)):
+        for j in index.query_bbox(seg_bounds[i]):
             if j <= i:
                 continue
             s2 = segs[j]
@@ -164,51 +179,77 @@ def run_min_trace_spacing(ctx: CheckContext) -> CheckResult:
         if n < 2:
             continue
 
-        # Physically connected copper is one conductor; only measure gaps
-        # BETWEEN conductors (#14).
-        groups = _conductor_groups(segs)
-        if len({groups.find(i) for i in range(n)}) >= 2:
-            had_separate_conductors = True
-
         # Index segments and only measure pairs whose bboxes are within the
         # search radius. The raw O(n^2) pair loop dominated this check's runtime
         # on real boards (~2000 segments/layer). The radius is sized from the
         # thresholds so any near-limit spacing is still found exactly; a board
         # whose nearest different-conductor copper is farther than the radius
-        # passes with margin, and precision there does not matter.
+        # passes with margin, and precision there does not matter. The same
+        # index serves the conductor grouping below.
         search_r = max(2.0, recommended_min * 20.0)
+        seg_bounds = [_segment_bounds(sg) for sg in segs]
+        seg_index = PolygonIndex.from_bounds(list(enumerate(seg_bounds)))
 
-        def _seg_bounds_m(sg: Segment) -> Bounds:
-            hw = 0.5 * sg.width_mm
-            return Bounds(min(sg.x1_mm, sg.x2_mm) - hw, min(sg.y1_mm, sg.y2_mm) - hw,
-                          max(sg.x1_mm, sg.x2_mm) + hw, max(sg.y1_mm, sg.y2_mm) + hw)
+        # Physically connected copper is one conductor; only measure gaps
+        # BETWEEN conductors (#14).
+        groups = _conductor_groups(segs, seg_bounds, seg_index)
+        # Conductor of each segment, resolved once: no unions happen below, so
+        # the pair loop compares plain ids instead of two finds per pair.
+        group_of = [groups.find(i) for i in range(n)]
+        if len(set(group_of)) >= 2:
+            had_separate_conductors = True
 
-        seg_index = PolygonIndex.from_bounds([(i, _seg_bounds_m(sg)) for i, sg in enumerate(segs)])
+        # Per-segment columns for the pair loop: centerline bbox, width and
+        # endpoints, so the reject test and the distance kernel below read them
+        # directly instead of re-deriving them from the Segment for every pair.
+        cl_boxes = [
+            (min(sg.x1_mm, sg.x2_mm), max(sg.x1_mm, sg.x2_mm),
+             min(sg.y1_mm, sg.y2_mm), max(sg.y1_mm, sg.y2_mm))
+            for sg in segs
+        ]
+        widths = [sg.width_mm for sg in segs]
+        ends = [((sg.x1_mm, sg.y1_mm), (sg.x2_mm, sg.y2_mm)) for sg in segs]
 
         for i in range(n):
-            s1 = segs[i]
-            b1 = _seg_bounds_m(s1)
+            g1 = group_of[i]
+            b1 = seg_bounds[i]
+            ax_min, ax_max, ay_min, ay_max = cl_boxes[i]
+            w1 = widths[i]
+            p1, p2 = ends[i]
             query = Bounds(b1.min_x - search_r, b1.min_y - search_r,
                            b1.max_x + search_r, b1.max_y + search_r)
             for j in seg_index.query_bbox(query):
                 if j <= i:
                     continue
-                s2 = segs[j]
-
-                if groups.find(i) == groups.find(j):
+                if group_of[j] == g1:
                     continue  # same conductor: a junction, not a gap
-
-                # Quick bbox reject
+                w2 = widths[j]
+
+                # Quick, SOUND reject. Center-to-center distance is NOT a lower
+                # bound on segment-to-segment distance (two long, parallel,
+                # offset traces can have far-apart midpoints yet a tiny gap),
+                # but the gap between the centerline bboxes is: every point of a
+                # segment lies inside its bbox. Less the half-widths, it bounds
+                # the copper spacing from below, so a pair is only skipped when
+                # even that cannot beat the current best -- the reported minimum
+                # does not depend on iteration order.
                 if min_spacing_mm is not None:
-                    if not _might_be_closer_than(s1, s2, min_spacing_mm):
+                    bx_min, bx_max, by_min, by_max = cl_boxes[j]
+                    dx = max(0.0, ax_min - bx_max, bx_min - ax_max)
+                    dy = max(0.0, ay_min - by_max, by_min - ay_max)
+                    bbox_gap = (dx * dx + dy * dy) ** 0.5
+                    if not bbox_gap - 0.5 * (w1 + w2) <= min_spacing_mm:
                         continue
 
-                dist_mm, mx_mm, my_mm = _segment_segment_distance_mm(s1, s2)
+                q1, q2 = ends[j]
+                dist_mm, cp1, cp2 = _closest_points_on_segments(p1, p2, q1, q2)
                 if dist_mm is None:
                     continue
+                mx_mm = 0.5 * (cp1[0] + cp2[0])
+                my_mm = 0.5 * (cp1[1] + cp2[1])
 
                 # Copper-to-copper spacing = center distance - half widths
-                spacing_mm = dist_mm - 0.5 * (s1.width_mm + s2.width_mm)
+                spacing_mm = dist_mm - 0.5 * (w1 + w2)
                 if spacing_mm < 0.0:
                     # Overlapping copper in different connected groups cannot
                     # happen (they would have been unioned), so this is float
@@ -298,9 +339,10 @@ def run_min_trace_spacing(ctx: CheckContext) -> CheckResult:
         # Define severity based on status
         severity = "error" if status == "fail" else "warning"
 
-        offenders_sorted = sorted(offenders, key=lambda t: t[0])
+        offenders_sorted = heapq.nsmallest(
+            MAX_REPORTED_VIOLATIONS, offenders, key=itemgetter(0))
         if offenders_sorted:
-            for spacing_mm, layer_name, mx_mm, my_mm in offenders_sorted[:MAX_REPORTED_VIOLATIONS]:
+            for spacing_mm, layer_name, mx_mm, my_mm in offenders_sorted:
                 msg = (
                     f"Trace spacing {spacing_mm:.3f} mm on layer {layer_name} is below "
                     f"recommended {recommended_min:.3f} mm (absolute minimum {absolute_min:.3f} mm)."
@@ -346,39 +388,6 @@ def run_min_trace_spacing(ctx: CheckContext) -> CheckResult:
     ).finalize()
 
 
-def _might_be_closer_than(s1: Segment, s2: Segment, limit_mm: float) -> bool:
-    """
-    Cheap, SOUND reject using the gap between the two segments' axis-aligned
-    bounding boxes.
-
-    Center-to-center distance is NOT a valid lower bound on segment-to-segment
-    distance: two long, parallel, offset traces can have far-apart midpoints yet
-    a tiny real gap, so a center-based prune would skip genuinely-close pairs and
-    miss the true minimum. The gap between the segments' bounding boxes, however,
-    IS a valid lower bound on the centerline distance (every point of a segment
-    lies inside its bbox). Subtracting the half-widths therefore gives a valid
-    lower bound on the copper-to-copper spacing.
-
-    We only reject a pair when even that optimistic lower bound cannot beat the
-    current best, so the reported minimum is independent of iteration order.
-    """
-    # Axis-aligned bbox of each segment's centerline.
-    ax_min, ax_max = (s1.x1_mm, s1.x2_mm) if s1.x1_mm <= s1.x2_mm else (s1.x2_mm, s1.x1_mm)
-    ay_min, ay_max = (s1.y1_mm, s1.y2_mm) if s1.y1_mm <= s1.y2_mm else (s1.y2_mm, s1.y1_mm)
-    bx_min, bx_max = (s2.x1_mm, s2.x2_mm) if s2.x1_mm <= s2.x2_mm else (s2.x2_mm, s2.x1_mm)
-    by_min, by_max = (s2.y1_mm, s2.y2_mm) if s2.y1_mm <= s2.y2_mm else (s2.y2_mm, s2.y1_mm)
-
-    # Separation between the bboxes on each axis (0 if they overlap on that axis).
-    dx = max(0.0, ax_min - bx_max, bx_min - ax_max)
-    dy = max(0.0, ay_min - by_max, by_min - ay_max)
-    bbox_gap = (dx * dx + dy * dy) ** 0.5
-
-    # Even if both traces were at their nearest bbox corners, spacing could not
-    # be smaller than: bbox_gap - half widths.
-    min_possible_spacing = bbox_gap - 0.5 * (s1.width_mm + s2.width_mm)
-    return min_possible_spacing <= limit_mm
-
-
 def _segment_segment_distance_mm(s1: Segment, s2: Segment) -> Tuple[Optional[float], float, float]:
     """
     Minimum distance between two finite line segments in mm, plus the midpoint
@@ -403,6 +412,25 @@ def _segment_segment_distance_mm(s1: Segment, s2: Segment) -> Tuple[Optional[flo
     return d, mx, my
 
 
+def _point_seg_dist(
+    px: float, py: float, ax: float, ay: float, bx: float, by: float
+) -> Tuple[float, float, float]:
+    """Distance from (px, py) to segment a-b, and the closest point on it."""
+    vx = bx - ax
+    vy = by - ay
+    if vx * vx + vy * vy < 1e-12:
+        dx = px - ax
+        dy = py - ay
+        return (dx * dx + dy * dy) ** 0.5, ax, ay
+    t0 = ((px - ax) * vx + (py - ay) * vy) / (vx * vx + vy * vy)
+    t0 = max(0.0, min(1.0, t0))
+    cx = ax + t0 * vx
+    cy = ay + t0 * vy
+    dx = px - cx
+    dy = py - cy
+    return (dx * dx + dy * dy) ** 0.5, cx, cy
+
+
 def _closest_points_on_segments(
     p1: Tuple[float, float],
     p2: Tuple[float, float],
@@ -451,31 +479,19 @@ def _closest_points_on_segments(
     else:
         # parallel or nearly so: fall back to endpoint-based search
         # by checking distances between endpoints and opposite segments.
-        candidates = []
-
-        def point_seg_dist(px, py, ax, ay, bx, by):
-            vx = bx - ax
-            vy = by - ay
-            if vx * vx + vy * vy < 1e-12:
-                dx = px - ax
-                dy = py - ay
-                return (dx * dx + dy * dy) ** 0.5, ax, ay
-            t0 = ((px - ax) * vx + (py - ay) * vy) / (vx * vx + vy * vy)
-            t0 = max(0.0, min(1.0, t0))
-            cx = ax + t0 * vx
-            cy = ay + t0 * vy
-            dx = px - cx
-            dy = py - cy
-            return (dx * dx + dy * dy) ** 0.5, cx, cy
-
-        for (px, py) in [p1, p2]:
-            d1, cx1, cy1 = point_seg_dist(px, py, x3, y3, x4, y4)
-            candidates.append((d1, (px, py), (cx1, cy1)))
-        for (qx, qy) in [q1, q2]:
-            d2, cx2, cy2 = point_seg_dist(qx, qy, x1, y1, x2, y2)
-            candidates.append((d2, (cx2, cy2), (qx, qy)))
-
-        dmin, cp_p, cp_q = min(candidates, key=lambda t: t[0])
+        # Four fixed candidates, compared in order with a strict < so the
+        # first of equal distances wins, as min() over them would.
+        dmin, cx, cy = _point_seg_dist(x1, y1, x3, y3, x4, y4)
+        cp_p, cp_q = p1, (cx, cy)
+        dd, cx, cy = _point_seg_dist(x2, y2, x3, y3, x4, y4)
+        if dd < dmin:
+            dmin, cp_p, cp_q = dd, p2, (cx, cy)
+        dd, cx, cy = _point_seg_dist(x3, y3, x1, y1, x2, y2)
+        if dd < dmin:
+            dmin, cp_p, cp_q = dd, (cx, cy), q1
+        dd, cx, cy = _point_seg_dist(x4, y4, x1, y1, x2, y2)
+        if dd < dmin:
+            dmin, cp_p, cp_q = dd, (cx, cy), q2
         return dmin, cp_p, cp_q
 
     # Closest points using clamped s, t
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
 from typing import List, Optional
 
 from ..engine.check_runner import register_check
@@ -130,10 +132,11 @@ def run_min_trace_width(ctx: CheckContext) -> CheckResult:
 
     violations: List[Violation] = []
     if status != "pass":
-        # Sort offenders by width ascending (worst first)
-        offenders_sorted = sorted(offenders, key=lambda t: t[0])
+        # The narrowest offenders first, capped at the report limit
+        offenders_sorted = heapq.nsmallest(
+            MAX_REPORTED_VIOLATIONS, offenders, key=itemgetter(0))
         if offenders_sorted:
-            for width_mm, layer_name, mx_mm, my_mm in offenders_sorted[:MAX_REPORTED_VIOLATIONS]:
+            for width_mm, layer_name, mx_mm, my_mm in offenders_sorted:
                 msg = (
                     f"Trace segment width {width_mm:.3f} mm on layer {layer_name} is below "
                     f"recommended {recommended_min:.3f} mm (absolute minimum {absolute_min:.3f} mm)."
@@ -22,9 +22,11 @@ advisory warning.
 
 from __future__ import annotations
 
+import heapq
 import math
 from collections import defaultdict
 from math import floor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -251,7 +253,8 @@ def run_npth_to_copper_clearance(ctx: CheckContext) -> CheckResult:
 
     violations: List[Violation] = []
     if status != "pass":
-        for clearance, layer_name, hx, hy in sorted(offenders, key=lambda t: t[0])[:MAX_REPORTED_VIOLATIONS]:
+        for clearance, layer_name, hx, hy in heapq.nsmallest(
+                MAX_REPORTED_VIOLATIONS, offenders, key=itemgetter(0)):
             violations.append(
                 Violation(
                     severity=ctx.check_def.severity,
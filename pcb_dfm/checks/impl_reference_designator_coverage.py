@@ -19,7 +19,7 @@ from ..geometry import queries
 from ..geometry.polygon_index import PolygonIndex
 from ..geometry.primitives import Bounds
 from ..results import CheckResult, ViolationLocation
-from ._design_advisory import advisory, count_metric, is_pad_like, na
+from ._design_advisory import advisory, count_metric, na, pad_like_bounds
 
 _CLUSTER_GAP_MM = 1.5     # pads within this are the same component
 _LABEL_RADIUS_MM = 4.0    # silk within this of the cluster is its refdes
@@ -67,12 +67,10 @@ def run_reference_designator_coverage(ctx: CheckContext) -> CheckResult:
     if not silk_layers:
         return na(ctx, "No silkscreen layer to check reference-designator coverage.")
 
-    pad_centers: List[Tuple[float, float]] = []
-    for layer in queries.get_copper_layers(geom):
-        for poly in layer.polygons:
-            if is_pad_like(poly):
-                b = poly.bounds()
-                pad_centers.append((0.5 * (b.min_x + b.max_x), 0.5 * (b.min_y + b.max_y)))
+    pad_centers: List[Tuple[float, float]] = [
+        (0.5 * (b.min_x + b.max_x), 0.5 * (b.min_y + b.max_y))
+        for _, b in pad_like_bounds(ctx)
+    ]
     if len(pad_centers) < 2:
         return na(ctx, "Too few component pads to infer components.")
 
@@ -186,7 +186,7 @@ def run_return_path_interruptions(ctx: CheckContext) -> CheckResult:
         return _na(ctx, target_max, limit_max,
                    "Fewer than two copper layers; no adjacent reference plane to evaluate.")
 
-    board = queries.get_board_bounds(ctx.geometry)
+    board = queries.get_or_build_board_bounds(ctx)
     board_area = ((board.max_x - board.min_x) * (board.max_y - board.min_y)) if board else 0.0
     plane_min_area = max(20.0, 0.15 * board_area) if board_area > 0 else 20.0
 
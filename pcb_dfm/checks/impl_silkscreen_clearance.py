@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from math import hypot
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
@@ -37,20 +37,24 @@ def _na(ctx: CheckContext, rec: float, ab: float, msg: str) -> CheckResult:
     ).finalize()
 
 
-def _edge_clearance(bb, board) -> float:
+def _edge_clearance_to(board: Bounds) -> Callable[[Tuple[float, float, float, float]], float]:
     """Signed clearance from a silk bbox to the board bounding box.
 
     Positive = silk sits inside the board with this much margin to the nearest
     edge; negative = silk pokes past the routed outline (printed on the rail /
     milled away). Uses the board bounding box, which is exact for the common
     rectangular outline and a close bound for others.
+
+    Returns a function of the silk bbox with the board edges bound as closure
+    constants, so the per-feature call does no attribute lookups.
     """
-    min_x, max_x, min_y, max_y = bb
-    left = min_x - board.min_x
-    right = board.max_x - max_x
-    bottom = min_y - board.min_y
-    top = board.max_y - max_y
-    return min(left, right, bottom, top)
+    bx0, bx1, by0, by1 = board.min_x, board.max_x, board.min_y, board.max_y
+
+    def clearance(bb: Tuple[float, float, float, float]) -> float:
+        min_x, max_x, min_y, max_y = bb
+        return min(min_x - bx0, bx1 - max_x, min_y - by0, by1 - max_y)
+
+    return clearance
 
 
 def _hole_clearance(bb, hx: float, hy: float, r: float) -> float:
@@ -77,7 +81,7 @@ def run_silkscreen_clearance(ctx: CheckContext) -> CheckResult:
     """
     rec, ab = _thresholds(ctx)
 
-    board = queries.get_board_bounds(ctx.geometry)
+    board = queries.get_or_build_board_bounds(ctx)
     if board is None:
         return _na(ctx, rec, ab, "No board outline available to evaluate silkscreen clearance.")
 
@@ -140,11 +144,12 @@ def run_silkscreen_clearance(ctx: CheckContext) -> CheckResult:
     # (clearance_mm, kind, x_mm, y_mm)
     offenders: List[Tuple[float, str, float, float]] = []
 
+    edge_clearance = _edge_clearance_to(board)
     for bb in silk_bboxes:
         min_x, max_x, min_y, max_y = bb
         cx, cy = 0.5 * (min_x + max_x), 0.5 * (min_y + max_y)
 
-        edge_clr = _edge_clearance(bb, board)
+        edge_clr = edge_clearance(bb)
         clr = edge_clr
         kind = "board edge"
 
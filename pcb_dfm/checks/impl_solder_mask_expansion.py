@@ -111,8 +111,15 @@ def _normalize_mask_polarity(mask_polygons: List[Polygon], board_area: float) ->
         return mask_polygons, "openings"
 
     # Calculate robust polarity detection metrics
-    total_mask_area = sum(_poly_area_mm2(poly) for poly in mask_polygons)
-    max_poly_area = max(_poly_area_mm2(poly) for poly in mask_polygons) if mask_polygons else 0.0
+    # One pass: each polygon's area is computed once and feeds both the total
+    # and the maximum.
+    total_mask_area = 0.0
+    max_poly_area = 0.0
+    for poly in mask_polygons:
+        area = _poly_area_mm2(poly)
+        total_mask_area += area
+        if area > max_poly_area:
+            max_poly_area = area
     n_polys = len(mask_polygons)
 
     # Robust heuristic:
@@ -149,68 +156,76 @@ def _invert_mask_coverage(coverage_polygons: List[Polygon], board_area: float) -
     return coverage_polygons
 
 
-def _distance_point_to_segment(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
-    """Calculate minimum distance from point to line segment."""
-    dx = x2 - x1
-    dy = y2 - y1
+def _polygon_edges(vertices) -> List[Tuple[float, float, float, float, float, float, Optional[float]]]:
+    """Per-edge constants of a closed polygon: (x1, y1, x2, y2, dx, dy, len_sq).
 
-    if abs(dx) < 1e-10 and abs(dy) < 1e-10:
-        # Segment is a point
-        return math.sqrt((px - x1)**2 + (py - y1)**2)
-
-    # Parameter t determines closest point on infinite line
-    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-
-    if t < 0:
-        # Closest point is segment start
-        return math.sqrt((px - x1)**2 + (py - y1)**2)
-    elif t > 1:
-        # Closest point is segment end
-        return math.sqrt((px - x2)**2 + (py - y2)**2)
-    else:
-        # Closest point is interior to segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-        return math.sqrt((px - closest_x)**2 + (py - closest_y)**2)
-
-
-def _min_distance_between_polygons(poly1, poly2) -> float:
-    """Calculate minimum distance between two polygons."""
-    if not hasattr(poly1, 'vertices') or not hasattr(poly2, 'vertices'):
-        return float('inf')
-
-    min_dist = float('inf')
-
-    # Check distances from vertices of poly1 to edges of poly2
-    for vertex in poly1.vertices:
-        dist = _min_distance_to_polygon_edges(vertex.x, vertex.y, poly2.vertices)
-        min_dist = min(min_dist, dist)
-
-    # Check distances from vertices of poly2 to edges of poly1
-    for vertex in poly2.vertices:
-        dist = _min_distance_to_polygon_edges(vertex.x, vertex.y, poly1.vertices)
-        min_dist = min(min_dist, dist)
-
-    return min_dist
-
-
-def _min_distance_to_polygon_edges(x: float, y: float, vertices) -> float:
-    """Find minimum distance from point to any polygon edge."""
+    ``len_sq`` is None for a degenerate (point-like) edge. Computed once per
+    polygon so the vertex-to-edge walk below does not redo them per vertex.
+    Fewer than three vertices is not a polygon and yields no edges.
+    """
     if len(vertices) < 3:
-        return float('inf')
-
-    min_dist = float('inf')
+        return []
+    edges = []
     n = len(vertices)
-
     for i in range(n):
         j = (i + 1) % n
         x1, y1 = vertices[i].x, vertices[i].y
         x2, y2 = vertices[j].x, vertices[j].y
+        dx = x2 - x1
+        dy = y2 - y1
+        if abs(dx) < 1e-10 and abs(dy) < 1e-10:
+            len_sq = None
+        else:
+            len_sq = dx * dx + dy * dy
+        edges.append((x1, y1, x2, y2, dx, dy, len_sq))
+    return edges
+
+
+def _min_sq_distance_to_edges(px: float, py: float, edges) -> float:
+    """Squared minimum distance from a point to any of ``edges`` (see _polygon_edges)."""
+    min_sq = math.inf
+    for x1, y1, x2, y2, dx, dy, len_sq in edges:
+        if len_sq is None:
+            # Segment is a point
+            d_sq = (px - x1)**2 + (py - y1)**2
+        else:
+            # Parameter t determines closest point on infinite line
+            t = ((px - x1) * dx + (py - y1) * dy) / len_sq
+            if t < 0:
+                d_sq = (px - x1)**2 + (py - y1)**2
+            elif t > 1:
+                d_sq = (px - x2)**2 + (py - y2)**2
+            else:
+                d_sq = (px - (x1 + t * dx))**2 + (py - (y1 + t * dy))**2
+        if d_sq < min_sq:
+            min_sq = d_sq
+    return min_sq
+
+
+def _min_distance_between_polygons(poly1, poly2) -> float:
+    """Calculate minimum distance between two polygons.
+
+    Every vertex of each polygon is measured against the other's edges. The
+    comparison runs on squared distances and takes a single square root at the
+    end; sqrt is monotone and correctly rounded, so the result is the same as
+    taking the minimum of the individual distances.
+    """
+    if not hasattr(poly1, 'vertices') or not hasattr(poly2, 'vertices'):
+        return float('inf')
 
-        dist = _distance_point_to_segment(x, y, x1, y1, x2, y2)
-        min_dist = min(min_dist, dist)
+    min_sq = math.inf
+    for vertices, edges in (
+        (poly1.vertices, _polygon_edges(poly2.vertices)),
+        (poly2.vertices, _polygon_edges(poly1.vertices)),
+    ):
+        if not edges:
+            continue
+        for vertex in vertices:
+            d_sq = _min_sq_distance_to_edges(vertex.x, vertex.y, edges)
+            if d_sq < min_sq:
+                min_sq = d_sq
 
-    return min_dist
+    return math.sqrt(min_sq)
 
 
 def _bbox_intersects(a, b) -> bool:
@@ -475,21 +490,25 @@ def run_solder_mask_expansion(ctx: CheckContext) -> CheckResult:
         pad_w = pad.max_x - pad.min_x
         pad_h = pad.max_y - pad.min_y
 
-        best_rank_for_pad = (2, math.inf)
+        # The pad's mask is the smallest opening containing it, else the
+        # smallest one merely intersecting it. Visiting candidates smallest
+        # first (a stable sort, so equal areas keep candidate order) makes the
+        # first containing opening the answer, and the rest need no testing.
         best_mask_for_pad: Optional[_MaskOpening] = None
+        best_contains = False
 
-        for m in _mask_candidates_for_pad(pad):
+        for m in sorted(_mask_candidates_for_pad(pad), key=lambda c: c.area):
             if pad.side and m.side and str(pad.side).lower() != str(m.side).lower():
                 continue
 
             if not _intersects(m.poly, pad.poly):
                 continue
 
-            contains = _contains(m.poly, pad.poly)
-            rank = (0 if contains else 1, m.area)
-
-            if rank < best_rank_for_pad:
-                best_rank_for_pad = rank
+            if _contains(m.poly, pad.poly):
+                best_mask_for_pad = m
+                best_contains = True
+                break
+            if best_mask_for_pad is None:
                 best_mask_for_pad = m
 
         if best_mask_for_pad is None:
@@ -504,7 +523,7 @@ def run_solder_mask_expansion(ctx: CheckContext) -> CheckResult:
             min_distance = _min_distance_between_polygons(pad.poly, m.poly)
 
             # Use containment-based sign logic instead of distance magnitude
-            if _contains(m.poly, pad.poly):
+            if best_contains:
                 # Mask fully contains pad, expansion is positive
                 expansion = min_distance
                 notes = "True distance-based expansion measurement (pad contained in mask)"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from ..engine.check_runner import register_check
 from ..engine.context import CheckContext
@@ -77,11 +77,17 @@ def run_unsupported_hole_types(ctx: CheckContext) -> CheckResult:
             violations=[viol],
         ).finalize()
 
-    diameters_mm: List[float] = []
+    # One streaming pass over the hits: only the out-of-range diameters are
+    # kept, rather than materialising every hit's diameter and filtering after.
+    any_hits = False
+    unsupported: List[float] = []
     for info in drill_files:
-        diameters_mm.extend(_extract_diameters_mm(info.path))
+        for d in _extract_diameters_mm(info.path):
+            any_hits = True
+            if d < min_supported or d > max_supported:
+                unsupported.append(d)
 
-    if not diameters_mm:
+    if not any_hits:
         msg = "No drill tools or hits found; cannot classify unsupported hole types."
         viol = Violation(
             severity="info",
@@ -107,9 +113,6 @@ def run_unsupported_hole_types(ctx: CheckContext) -> CheckResult:
             violations=[viol],
         ).finalize()
 
-    unsupported: List[float] = [
-        d for d in diameters_mm if d < min_supported or d > max_supported
-    ]
     count_unsupported = len(unsupported)
 
     # Decide status based on count vs allowed
@@ -166,6 +169,6 @@ def run_unsupported_hole_types(ctx: CheckContext) -> CheckResult:
     )
 
 
-def _extract_diameters_mm(path: Path) -> List[float]:
+def _extract_diameters_mm(path: Path) -> Iterator[float]:
     """Drill diameters in mm, via the gerbonara parse backend (#3)."""
-    return [h.diameter_mm for h in excellon_hits_mm(path)]
+    return (h.diameter_mm for h in excellon_hits_mm(path))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import heapq
 import math
 from collections import defaultdict
 from dataclasses import dataclass
 from math import floor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -23,31 +25,9 @@ from .impl_min_annular_ring import (
     _min_distance_to_polygon_edges,
 )
 
-_INCH_TO_MM = 25.4
 MAX_REPORTED_VIOLATIONS = 100
 
 
-def _detect_excellon_units(drill_file) -> str:
-    """Detect Excellon file units from header."""
-    # Try to get units from the file object
-    if hasattr(drill_file, 'units'):
-        units = getattr(drill_file, 'units', None)
-        if units in ('inch', 'mm'):
-            return units
-
-    # Try to detect from header/comments
-    if hasattr(drill_file, 'header'):
-        header = getattr(drill_file, 'header', '')
-        if isinstance(header, str):
-            if 'M71' in header.upper():
-                return 'mm'
-            elif 'M72' in header.upper():
-                return 'inch'
-
-    # Default to inch if undetectable
-    return 'inch'
-
-
 @dataclass
 class DrillHit:
     x_mm: float
@@ -587,9 +567,10 @@ def run_via_to_copper_clearance(ctx: CheckContext) -> CheckResult:
 
     violations: List[Violation] = []
     if status != "pass":
-        offenders_sorted = sorted(offenders, key=lambda t: t[0])
+        offenders_sorted = heapq.nsmallest(
+            MAX_REPORTED_VIOLATIONS, offenders, key=itemgetter(0))
         if offenders_sorted:
-            for clearance, layer_name, vx, vy, mx, my in offenders_sorted[:MAX_REPORTED_VIOLATIONS]:
+            for clearance, layer_name, vx, vy, mx, my in offenders_sorted:
                 msg = (
                     f"Minimum via-to-copper clearance {clearance:.3f} mm on layer {layer_name} is below "
                     f"recommended {recommended_min:.3f} mm (absolute minimum {absolute_min:.3f} mm)."
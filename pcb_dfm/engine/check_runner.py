@@ -111,8 +111,23 @@ def register_check(check_id: str) -> Callable[[CheckFn], CheckFn]:
     """
     Decorator used by individual check implementations to register
     their runner.
+
+    A second, different runner for an id already taken raises ValueError
+    rather than silently replacing the first (a stale copy of a check left in
+    the tree would otherwise win or lose depending on import order).
+    Re-registering the same function, e.g. on a module reload, is allowed.
     """
     def decorator(fn: CheckFn) -> CheckFn:
+        existing = _REGISTRY.get(check_id)
+        if existing is not None and (
+            (existing.__module__, existing.__qualname__)
+            != (fn.__module__, fn.__qualname__)
+        ):
+            raise ValueError(
+                f"Duplicate runner for check id {check_id!r}: "
+                f"{fn.__module__}.{fn.__qualname__} would replace "
+                f"{existing.__module__}.{existing.__qualname__}"
+            )
         _REGISTRY[check_id] = fn
         return fn
     return decorator
@@ -21,10 +21,10 @@ import os
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .excellon_fallback import parse_excellon_mm
-from .primitives import Point2D, Polygon
+from .primitives import Polygon
 
 
 def _cache_by_path_mtime(fn):
@@ -33,7 +33,9 @@ def _cache_by_path_mtime(fn):
     A single run parses the same Gerber several times over: the geometry build
     reads each layer, and then trace/edge checks re-read the copper and outline
     from the file (their centreline/edge form is not in the polygon geometry).
-    On the reference board top_copper was parsed FOUR times. The results depend
+    On the reference board top_copper was parsed FOUR times. Drill files are
+    worse: well over a dozen checks each read the hits of every Excellon file,
+    so the opened Excellon object is memoized too. The results depend
     only on the file, so this returns the first parse to every later caller of
     the same unchanged file -- transparently, with the same objects.
 
@@ -181,7 +183,7 @@ def _object_polygons_mm(obj) -> List[Polygon]:
             continue
         pts = _arcpoly_points(arc_poly, flip_handedness=flip)
         if len(pts) >= 3:
-            polys.append(Polygon(vertices=[Point2D(x=x, y=y) for x, y in pts]))
+            polys.append(Polygon.from_xy(pts))
     return polys
 
 
@@ -617,7 +619,7 @@ def outline_open_endpoints_mm(path: Path, tol: float = 1e-3) -> List[Tuple[float
 # Excellon (drills / slots)
 # --------------------------------------------------------------------------- #
 
-@dataclass
+@dataclass(slots=True)
 class DrillHit:
     """A drilled hole in mm."""
     x_mm: float
@@ -626,7 +628,7 @@ class DrillHit:
     plated: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DrillSlot:
     """A routed slot in mm (``width_mm`` is the routing tool diameter)."""
     x1_mm: float
@@ -637,6 +639,7 @@ class DrillSlot:
     plated: Optional[bool] = None
 
 
+@_cache_by_path_mtime
 def _open_excellon(path: Path):
     if not GERBONARA_AVAILABLE:
         return None
@@ -648,6 +651,7 @@ def _open_excellon(path: Path):
         return None
 
 
+@_cache_by_path_mtime
 def excellon_hits_mm(path: Path) -> List[DrillHit]:
     """Drilled holes in mm. Slots are reported by :func:`excellon_slots_mm`."""
     ex = _open_excellon(path)
@@ -669,15 +673,25 @@ def excellon_hits_mm(path: Path) -> List[DrillHit]:
             objs = list(ex.objects)
         except Exception:
             return []
+    # Hits share a handful of tool objects, so each tool's guarded unit
+    # conversion runs once rather than once per hit.
+    tool_dia: Dict[int, float] = {}
+    # Coordinates go through the hit's own unit straight to mm -- the same
+    # conversion ``obj.converted("mm")`` applies, minus the per-hit object copy
+    # and dataclass field walk it does to get there.
+    to_mm = MM.convert_from
     for obj in objs:
+        tool = getattr(obj, "tool", None)
+        dia = tool_dia.get(id(tool))
+        if dia is None:
+            dia = tool_dia[id(tool)] = _tool_diameter_mm(tool)
+        if dia <= 0.0:
+            continue
         try:
-            m = obj.converted("mm")
-            dia = _tool_diameter_mm(getattr(obj, "tool", None))
-            if dia <= 0.0:
-                continue
+            unit = obj.unit
             hits.append(DrillHit(
-                x_mm=float(m.x), y_mm=float(m.y), diameter_mm=dia,
-                plated=getattr(m, "plated", None),
+                x_mm=float(to_mm(unit, obj.x)), y_mm=float(to_mm(unit, obj.y)),
+                diameter_mm=dia, plated=getattr(obj, "plated", None),
             ))
         except Exception:
             continue
@@ -695,6 +709,7 @@ def _fallback_slots_mm(path: Path) -> List[DrillSlot]:
     ]
 
 
+@_cache_by_path_mtime
 def excellon_slots_mm(path: Path) -> List[DrillSlot]:
     """Routed slots in mm."""
     ex = _open_excellon(path)
@@ -721,6 +736,25 @@ def excellon_slots_mm(path: Path) -> List[DrillSlot]:
     return out
 
 
+@_cache_by_path_mtime
 def excellon_tool_diameters_mm(path: Path) -> List[float]:
-    """Distinct drill tool diameters in mm (hole sizes actually used)."""
-    return sorted({h.diameter_mm for h in excellon_hits_mm(path)})
+    """Distinct drill tool diameters in mm (hole sizes actually used).
+
+    Only the tools matter here, so hits are reduced to the distinct tool
+    objects they reference before any unit conversion: a board with thousands
+    of holes and a dozen tools converts a dozen diameters, not thousands of
+    hits. Tools defined in the header but never drilled are still excluded.
+    """
+    ex = _open_excellon(path)
+    if ex is None:
+        return sorted({h.diameter_mm for h in excellon_hits_mm(path)})
+    try:
+        objs = list(ex.drills())
+    except Exception:
+        try:
+            objs = list(ex.objects)
+        except Exception:
+            return []
+    used = {id(t): t for t in (getattr(obj, "tool", None) for obj in objs)}
+    dias = {_tool_diameter_mm(t) for t in used.values()}
+    return sorted(d for d in dias if d > 0.0)
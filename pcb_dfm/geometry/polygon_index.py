@@ -153,7 +153,7 @@ class PolygonIndex:
     # Cell math
     # ------------------------------------------------------------------ #
     def _cell_coord(self, v: float) -> int:
-        return int(math.floor(v / self.cell_size))
+        return math.floor(v / self.cell_size)
 
     def cell_of(self, x: float, y: float) -> Cell:
         """Return the ``(cx, cy)`` grid cell containing point ``(x, y)``."""
@@ -202,16 +202,43 @@ class PolygonIndex:
         whose polygons truly overlap. The result is refined to items whose
         *stored bounding box* actually overlaps the query box (touching edges
         count as overlap), removing candidates that merely shared a grid cell.
+
+        A query box spanning more cells than the grid has occupied cells (a
+        plane-sized pour inflated by a clearance radius, say) walks the
+        occupied cells instead of sweeping the mostly-empty cell range. They
+        are visited in the same row-major order, so the result is identical.
         """
         out: List[object] = []
         seen: set = set()
-        for cell in self._cells_for_bounds(bounds):
-            for pos in self._grid.get(cell, ()):
+        # The cell math and the overlap test are inlined: this is the inner
+        # loop of every broad-phase check, called once per feature.
+        cs = self.cell_size
+        grid = self._grid
+        q_min_x, q_min_y = bounds.min_x, bounds.min_y
+        q_max_x, q_max_y = bounds.max_x, bounds.max_y
+        ix0 = math.floor(q_min_x / cs)
+        ix1 = math.floor(q_max_x / cs)
+        iy0 = math.floor(q_min_y / cs)
+        iy1 = math.floor(q_max_y / cs)
+        cells: Iterable[Cell]
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(grid):
+            cells = sorted(
+                (c for c in grid if ix0 <= c[0] <= ix1 and iy0 <= c[1] <= iy1),
+                key=lambda c: (c[1], c[0]),
+            )
+        else:
+            cells = [(ix, iy) for iy in range(iy0, iy1 + 1) for ix in range(ix0, ix1 + 1)]
+        item_bounds = self._bounds
+        ids = self._ids
+        for cell in cells:
+            for pos in grid.get(cell, ()):
                 if pos in seen:
                     continue
                 seen.add(pos)
-                if _bounds_overlap(self._bounds[pos], bounds):
-                    out.append(self._ids[pos])
+                b = item_bounds[pos]
+                if not (b.max_x < q_min_x or b.min_x > q_max_x
+                        or b.max_y < q_min_y or b.min_y > q_max_y):
+                    out.append(ids[pos])
         return out
 
     def nearby(self, bounds: Bounds, radius_mm: float) -> List[object]:
@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point2D:
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Bounds:
     """
     Axis aligned bounding box in mm.
@@ -51,13 +51,38 @@ class Polygon:
     interior ``holes`` (clearance voids -- e.g. a plane antipad, or any region
     a Gerber clear-polarity object cut out of the copper).
 
-    ``bounds`` is the exterior extent; the holes are always inside it.
+    ``bounds`` is the exterior extent; the holes are always inside it. The
+    extent is computed from the vertices once and memoised, so the ring must
+    not be edited after the first ``bounds()`` call.
     """
     vertices: List[Point2D]
     holes: List[List[Point2D]] = field(default_factory=list)
+    _extent: Optional[Tuple[float, float, float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_xy(cls, pts: Iterable[Tuple[float, float]]) -> "Polygon":
+        """Build a polygon from raw ``(x, y)`` tuples, fixing its extent in the
+        same pass so ``bounds()`` never has to walk the ring."""
+        xy = list(pts)
+        if not xy:
+            raise ValueError("Cannot build a polygon from an empty point list")
+        xs = [x for x, _ in xy]
+        ys = [y for _, y in xy]
+        poly = cls(vertices=[Point2D(x=x, y=y) for x, y in xy])
+        poly._extent = (min(xs), min(ys), max(xs), max(ys))
+        return poly
 
     def bounds(self) -> Bounds:
-        return Bounds.from_points(self.vertices)
+        # A fresh Bounds per call: callers (BoardLayer.bounds among them)
+        # grow the returned box in place.
+        ext = self._extent
+        if ext is None:
+            b = Bounds.from_points(self.vertices)
+            self._extent = (b.min_x, b.min_y, b.max_x, b.max_y)
+            return b
+        return Bounds(*ext)
 
     def contains_point(self, x: float, y: float) -> bool:
         """True when (x, y) is on copper: inside the exterior ring and outside
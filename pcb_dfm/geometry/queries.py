@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .layer_model import BoardGeometry, BoardLayer
 from .primitives import Bounds, Polygon
@@ -59,7 +59,11 @@ def geometry_extent_plausible(geom: BoardGeometry) -> bool:
     Uses the extent of ALL polygons, not just the outline, so a single stray
     huge feature on any layer is caught even when the outline itself is sane.
     """
-    bounds = geom.board_bounds()
+    return bounds_extent_plausible(geom.board_bounds())
+
+
+def bounds_extent_plausible(bounds: Optional[Bounds]) -> bool:
+    """:func:`geometry_extent_plausible` for an already computed extent."""
     if bounds is None:
         return True
     return (
@@ -100,3 +104,160 @@ def get_layer_bounds(layer: BoardLayer) -> Optional[Bounds]:
     Get bounds for a single BoardLayer, if it has polygons.
     """
     return layer.bounds()
+
+
+def _build_polygon_bounds(geom: BoardGeometry) -> Dict[int, List[Bounds]]:
+    return {
+        id(layer): [poly.bounds() for poly in layer.polygons]
+        for layer in geom.layers
+    }
+
+
+def get_or_build_polygon_bounds(ctx) -> Dict[int, List[Bounds]]:
+    """
+    Bounds of every polygon, keyed by layer identity (``id(layer)``) and
+    index-aligned with ``layer.polygons``.
+
+    Keyed by identity, not by ``logical_layer``: that name is not unique (both
+    paste layers come out as "Other", for one), and a name key would let one
+    layer's boxes overwrite another's.
+
+    Cached accessor: built once per run and shared through the context's
+    geometry cache, so the checks that walk every copper polygon do not each
+    re-derive every bbox from its vertex list. Callers must treat the returned
+    ``Bounds`` as read-only.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_polygon_bounds(ctx.geometry)
+    return cache.get_or_compute(
+        cache.key("polygon_bounds"), lambda: _build_polygon_bounds(ctx.geometry))
+
+
+def _build_polygon_bbox_areas(ctx) -> Dict[int, List[float]]:
+    return {
+        key: [max(0.0, (b.max_x - b.min_x) * (b.max_y - b.min_y)) for b in bounds]
+        for key, bounds in get_or_build_polygon_bounds(ctx).items()
+    }
+
+
+def get_or_build_polygon_bbox_areas(ctx) -> Dict[int, List[float]]:
+    """
+    Bounding-box area (mm^2) of every polygon, keyed by layer identity
+    (``id(layer)``) and index-aligned with ``layer.polygons``.
+
+    Derived from :func:`get_or_build_polygon_bounds` and cached the same way,
+    so the copper checks that filter or sum on bbox area share one pass.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_polygon_bbox_areas(ctx)
+    return cache.get_or_compute(
+        cache.key("polygon_bbox_areas"), lambda: _build_polygon_bbox_areas(ctx))
+
+
+def _build_layer_bbox_area(ctx) -> Dict[int, float]:
+    totals: Dict[int, float] = {}
+    for key, areas in get_or_build_polygon_bbox_areas(ctx).items():
+        total = 0.0
+        for a in areas:
+            total += a
+        totals[key] = total
+    return totals
+
+
+def get_or_build_layer_bbox_area(ctx) -> Dict[int, float]:
+    """
+    Total polygon bbox area (mm^2) per layer, keyed by ``id(layer)``.
+
+    Overlapping polygons are counted twice, so callers expressing this as a
+    coverage fraction should clamp it to the board area. Cached alongside
+    :func:`get_or_build_polygon_bbox_areas`.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_layer_bbox_area(ctx)
+    return cache.get_or_compute(
+        cache.key("layer_bbox_area"), lambda: _build_layer_bbox_area(ctx))
+
+
+def _build_layer_bounds(ctx) -> Dict[int, Optional[Bounds]]:
+    out: Dict[int, Optional[Bounds]] = {}
+    for key, bounds in get_or_build_polygon_bounds(ctx).items():
+        if not bounds:
+            out[key] = None
+            continue
+        first = bounds[0]
+        agg = Bounds(first.min_x, first.min_y, first.max_x, first.max_y)
+        for b in bounds:
+            agg.include_bounds(b)
+        out[key] = agg
+    return out
+
+
+def get_or_build_layer_bounds(ctx) -> Dict[int, Optional[Bounds]]:
+    """
+    Aggregate bounds of each layer's polygons, keyed by ``id(layer)``
+    (``None`` for a layer with no polygons). Every polygon bbox lies inside
+    its layer's box, which lets a check rule a whole layer out with one test
+    before walking it.
+    Cached alongside :func:`get_or_build_polygon_bounds`; read-only.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return _build_layer_bounds(ctx)
+    return cache.get_or_compute(
+        cache.key("layer_bounds"), lambda: _build_layer_bounds(ctx))
+
+
+def _union_bounds(boxes: Iterable[Optional[Bounds]]) -> Optional[Bounds]:
+    out: Optional[Bounds] = None
+    for b in boxes:
+        if b is None:
+            continue
+        if out is None:
+            out = Bounds(b.min_x, b.min_y, b.max_x, b.max_y)
+        else:
+            out.include_bounds(b)
+    return out
+
+
+def _build_geometry_bounds(ctx) -> Optional[Bounds]:
+    layer_bounds = get_or_build_layer_bounds(ctx)
+    return _union_bounds(layer_bounds[id(layer)] for layer in ctx.geometry.layers)
+
+
+def get_or_build_geometry_bounds(ctx) -> Optional[Bounds]:
+    """
+    Extent of every polygon on every layer -- ``geom.board_bounds()`` --
+    derived from the cached layer bounds and cached itself, so the extent
+    guard and the checks that consult it share one computation per run.
+    Read-only.
+
+    The union walks ``geom.layers`` itself, so every layer is counted exactly
+    as ``board_bounds()`` counts it -- including layers sharing a logical
+    name. Missing one would let the implausible-extent guard pass corrupt
+    artwork whose stray far feature sits on that layer.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return ctx.geometry.board_bounds()
+    return cache.get_or_compute(cache.key("geometry_bounds"), lambda: _build_geometry_bounds(ctx))
+
+
+def _build_board_bounds(ctx) -> Optional[Bounds]:
+    outline = get_outline_layer(ctx.geometry)
+    if outline and outline.polygons:
+        return get_or_build_layer_bounds(ctx)[id(outline)]
+    return get_or_build_geometry_bounds(ctx)
+
+
+def get_or_build_board_bounds(ctx) -> Optional[Bounds]:
+    """
+    :func:`get_board_bounds` memoised in the context's geometry cache, so the
+    outline scan runs once per run rather than once per check. Read-only.
+    """
+    cache = getattr(ctx, "geometry_cache", None)
+    if cache is None:
+        return get_board_bounds(ctx.geometry)
+    return cache.get_or_compute(cache.key("board_bounds"), lambda: _build_board_bounds(ctx))
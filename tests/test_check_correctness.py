@@ -241,6 +241,18 @@ def test_impedance_control_not_applicable_without_design_data(tmp_path):
     assert result.metric.measured_value is None
 
 
+def test_impedance_control_not_applicable_results_are_independent(tmp_path):
+    z = make_gerber_zip(tmp_path, {"board.gtl": _copper_trace(0.20)})
+    check = load_check_definition("impedance_control")
+    first = run_single_check(z, check)
+    first.metric.measured_value = 1.0
+    first.violations[0].message = "mutated"
+    # Editing one result must not leak into the next run's result.
+    second = run_single_check(z, check)
+    assert second.metric.measured_value is None
+    assert second.violations[0].message != "mutated"
+
+
 # ==========================================================================
 # 8. solder_paste_area_coverage -- paste aperture over a copper pad.
 # ==========================================================================
@@ -0,0 +1,27 @@
+"""The check registry refuses a second, different runner for a taken id."""
+
+from __future__ import annotations
+
+import pytest
+
+from pcb_dfm.checks import _ensure_impls_loaded
+from pcb_dfm.engine.check_runner import _REGISTRY, register_check
+
+
+def test_duplicate_check_id_raises():
+    _ensure_impls_loaded()
+    original = _REGISTRY["drill_to_drill_spacing"]
+
+    def run_drill_to_drill_spacing(ctx):  # a stray second copy of the check
+        raise AssertionError("must never be registered")
+
+    with pytest.raises(ValueError, match="drill_to_drill_spacing"):
+        register_check("drill_to_drill_spacing")(run_drill_to_drill_spacing)
+    assert _REGISTRY["drill_to_drill_spacing"] is original
+
+
+def test_reregistering_the_same_runner_is_allowed():
+    _ensure_impls_loaded()
+    original = _REGISTRY["drill_to_drill_spacing"]
+    assert register_check("drill_to_drill_spacing")(original) is original
+    assert _REGISTRY["drill_to_drill_spacing"] is original
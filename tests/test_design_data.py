@@ -133,6 +133,18 @@ def test_dielectric_uniformity_pass_from_ipc2581():
     assert r.metric.measured_value == pytest.approx(0.0, abs=1e-6)
 
 
+def test_dielectric_uniformity_not_applicable_results_are_independent():
+    # One dielectric is not enough to compare -> not_applicable; editing that
+    # result must not leak into the next run's result.
+    first = _run("dielectric_thickness_uniformity", {"stackup": {"dielectric_layers_mm": [0.20]}})
+    assert first.status == "not_applicable"
+    first.metric.measured_value = 1.0
+    first.violations[0].message = "mutated"
+    second = _run("dielectric_thickness_uniformity", {"stackup": {"dielectric_layers_mm": [0.20]}})
+    assert second.metric.measured_value is None
+    assert second.violations[0].message != "mutated"
+
+
 # --------------------------------------------------------------------------
 # Stackup material (core/prepreg) and declared layer sequence
 # --------------------------------------------------------------------------
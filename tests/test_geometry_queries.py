@@ -0,0 +1,53 @@
+"""The cached per-layer geometry tables must keep same-named layers apart.
+
+``logical_layer`` is not unique -- both paste layers, for one, come out as
+"Other" -- so tables keyed by it silently dropped all but the last such layer.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from pcb_dfm.engine.geometry_cache import GeometryCache
+from pcb_dfm.geometry import queries
+from pcb_dfm.geometry.layer_model import BoardGeometry, BoardLayer
+from pcb_dfm.geometry.primitives import Polygon
+
+
+def _square(x: float, y: float, size: float) -> Polygon:
+    return Polygon.from_xy([(x, y), (x + size, y), (x + size, y + size), (x, y + size)])
+
+
+def _two_same_named_layers():
+    geom = BoardGeometry(root_dir=Path("."))
+    top = BoardLayer(name="board.gtp", logical_layer="Other", side="Top", layer_type="other",
+                     polygons=[_square(0.0, 0.0, 1.0), _square(5.0, 5.0, 1.0)])
+    bottom = BoardLayer(name="board.gbp", logical_layer="Other", side="Bottom", layer_type="other",
+                        polygons=[_square(20.0, 20.0, 2.0)])
+    geom.add_layer(top)
+    geom.add_layer(bottom)
+    ctx = SimpleNamespace(geometry=geom, geometry_cache=GeometryCache())
+    return ctx, top, bottom
+
+
+def test_polygon_tables_stay_aligned_for_same_named_layers():
+    ctx, top, bottom = _two_same_named_layers()
+
+    poly_bounds = queries.get_or_build_polygon_bounds(ctx)
+    for layer in (top, bottom):
+        boxes = poly_bounds[id(layer)]
+        assert len(boxes) == len(layer.polygons)
+        for poly, b in zip(layer.polygons, boxes):
+            assert b == poly.bounds()
+
+    areas = queries.get_or_build_polygon_bbox_areas(ctx)
+    assert areas[id(top)] == [1.0, 1.0]
+    assert areas[id(bottom)] == [4.0]
+    totals = queries.get_or_build_layer_bbox_area(ctx)
+    assert totals[id(top)] == 2.0
+    assert totals[id(bottom)] == 4.0
+
+    layer_bounds = queries.get_or_build_layer_bounds(ctx)
+    assert layer_bounds[id(top)] == top.bounds()
+    assert layer_bounds[id(bottom)] == bottom.bounds()
@@ -62,3 +62,17 @@ def test_polygons_are_mm_not_inches(tmp_path):
     # If units were mis-scaled (inch<->mm) these would be off by 25.4x.
     assert -0.15 < min(xs) < 0.05
     assert 1.95 < max(xs) < 2.25
+
+
+def test_parsed_polygon_bounds_match_their_vertices(tmp_path):
+    # Extents are fixed at parse time; they must agree with the ring itself.
+    if not GERBONARA_AVAILABLE:  # pragma: no cover
+        return
+    f = tmp_path / "arc.gtl"
+    f.write_text(_ARC_GERBER, encoding="utf-8")
+    for p in gerber_polygons_mm(f):
+        b = p.bounds()
+        assert b.min_x == min(v.x for v in p.vertices)
+        assert b.max_x == max(v.x for v in p.vertices)
+        assert b.min_y == min(v.y for v in p.vertices)
+        assert b.max_y == max(v.y for v in p.vertices)
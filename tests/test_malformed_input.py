@@ -126,3 +126,33 @@ def test_real_boards_are_not_affected_by_the_extent_guard():
         assert geometry_extent_plausible(build_geometry_for(board)), (
             f"{name}: the extent guard must not fire on a real board"
         )
+
+
+def test_extent_guard_sees_every_same_named_layer(tmp_path):
+    """Both paste layers come out with logical_layer "Other". A stray far feature
+    on the first of them must still trip the guard: the cached extent the guard
+    reads has to cover every layer, exactly as ``geom.board_bounds()`` does."""
+    from types import SimpleNamespace
+
+    from pcb_dfm.engine.geometry_cache import GeometryCache
+    from pcb_dfm.engine.run import build_geometry_for
+    from pcb_dfm.geometry.queries import bounds_extent_plausible, get_or_build_geometry_bounds
+
+    hdr = "%FSLAX46Y46*%\n%MOMM*%\n%ADD10C,0.2*%\n%ADD11R,1X1*%\n"
+    z = tmp_path / "paste.zip"
+    with zipfile.ZipFile(z, "w") as zf:
+        zf.writestr("board.gtl", hdr + "D10*\nX0Y0D02*\nX10000000Y0D01*\nM02*\n")
+        # A 1 mm square at (5000, 5000) mm: corrupt artwork, far off any board.
+        zf.writestr("board.gtp", hdr + "D11*\nX1000000Y1000000D03*\n"
+                                       "X5000000000Y5000000000D03*\nM02*\n")
+        zf.writestr("board.gbp", hdr + "D11*\nX2000000Y2000000D03*\nM02*\n")
+
+    geom = build_geometry_for(z)
+    same_named = [layer for layer in geom.layers if layer.logical_layer == "Other"]
+    assert len(same_named) == 2
+    far = max(same_named, key=lambda layer: layer.bounds().max_x)
+    assert far is same_named[0], "the far feature must sit on the layer a name key would drop"
+
+    ctx = SimpleNamespace(geometry=geom, geometry_cache=GeometryCache())
+    assert get_or_build_geometry_bounds(ctx) == geom.board_bounds()
+    assert not bounds_extent_plausible(get_or_build_geometry_bounds(ctx))
@@ -54,13 +54,13 @@ def test_etch_margin_passes_comfortable_board():
 # --- silkscreen_clearance ----------------------------------------------------
 
 def test_silk_edge_clearance_sign():
-    from pcb_dfm.checks.impl_silkscreen_clearance import _edge_clearance
+    from pcb_dfm.checks.impl_silkscreen_clearance import _edge_clearance_to
 
     board = Bounds(min_x=0.0, min_y=0.0, max_x=20.0, max_y=14.0)
     inside = (5.0, 6.0, 5.0, 6.0)          # 1x1 silk, >= 5 mm from every edge
-    assert math.isclose(_edge_clearance(inside, board), 5.0, abs_tol=1e-9)
+    assert math.isclose(_edge_clearance_to(board)(inside), 5.0, abs_tol=1e-9)
     over_edge = (19.5, 20.5, 5.0, 6.0)     # pokes 0.5 mm past the right edge
-    assert _edge_clearance(over_edge, board) < 0.0
+    assert _edge_clearance_to(board)(over_edge) < 0.0
 
 
 def test_silk_hole_clearance_sign():
@@ -118,6 +118,28 @@ def test_registration_reuses_annular_ring_geometry():
     assert math.isclose(ring, 0.3, abs_tol=1e-9)
 
 
+def test_annular_ring_finds_pads_from_the_hole_cell_alone():
+    """Each hole is matched against its own grid cell only, so a pad spanning
+    many cells, and a hole sitting exactly on a pad edge that is also a cell
+    boundary, must still be found."""
+    from pcb_dfm.checks.impl_min_annular_ring import DrillHole, compute_min_annular_ring
+
+    def square(cx, cy, h):
+        return Polygon.from_xy([(cx - h, cy - h), (cx + h, cy - h), (cx + h, cy + h), (cx - h, cy + h)])
+
+    big = square(1.0, 1.0, 1.5)      # x -0.5..2.5: spans several 0.5 mm cells
+    edge = square(4.25, 1.0, 0.25)   # left edge x = 4.0, a cell boundary
+    pads = [(big, "Top"), (edge, "Bottom")]
+
+    ring, x, y, layer = compute_min_annular_ring([DrillHole(2.0, 1.0, 0.3)], pads)
+    assert math.isclose(ring, 0.5 - 0.15, abs_tol=1e-9) and layer == "Top"
+
+    # On the edge counts as inside (ring clamps to 0), on either side of the boundary.
+    for hx in (4.0, 4.0 - 1e-12):
+        found = compute_min_annular_ring([DrillHole(hx, 1.0, 0.3)], pads)
+        assert found is not None and found[0] == 0.0 and found[3] == "Bottom"
+
+
 def test_registration_budget_thresholds_are_micron_scale():
     """The µm metric must plumb to a 50 µm target / 25 µm floor in mm."""
     from pcb_dfm.checks.definitions import load_check_definitions_for_ruleset
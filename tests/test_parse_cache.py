@@ -51,3 +51,22 @@ def test_a_changed_file_is_reparsed_not_served_stale(tmp_path):
     assert gerber_traces_mm(p)[0].width_mm == pytest.approx(0.80), (
         "a modified file must be re-parsed, not returned from the cache"
     )
+
+
+_TWO_HOLES = (
+    "M48\nMETRIC,TZ\nT1C0.800\n%\nT1\nX1.0Y1.0\nX5.0Y1.0\nM30\n"
+)
+
+
+def test_drill_hits_are_parsed_once_per_file(tmp_path):
+    """Many checks read the same drill file's hits; the second read must be the
+    cached parse, not a fresh one."""
+    from pcb_dfm.geometry.gerber_backend import excellon_hits_mm
+
+    p = tmp_path / "board.drl"
+    p.write_text(_TWO_HOLES)
+
+    first = excellon_hits_mm(p)
+    assert len(first) == 2
+    assert first[0].diameter_mm == pytest.approx(0.8)
+    assert excellon_hits_mm(p) is first
@@ -163,3 +163,20 @@ def test_auto_cell_size_query_is_superset():
         brute = {j for j, qj in enumerate(boxes) if _bounds_overlap(qi, qj)}
         candidates = set(idx.query_bbox(qi))
         assert brute <= candidates
+
+
+def test_query_bbox_oversized_query_keeps_order():
+    # A query far larger than the occupied grid takes the sparse path; it must
+    # return exactly what the dense cell sweep returns, in the same order.
+    boxes = _deterministic_boxes(200)
+    idx = PolygonIndex.from_bounds(list(enumerate(boxes)), cell_size=0.5)
+    huge = _box(-1000.0, -1000.0, 1000.0, 1000.0)
+    dense = []
+    seen = set()
+    for cell in idx._cells_for_bounds(_box(-1.0, -1.0, 60.0, 60.0)):
+        for pos in idx._grid.get(cell, ()):
+            if pos not in seen:
+                seen.add(pos)
+                dense.append(pos)
+    assert idx.query_bbox(huge) == dense
+    assert sorted(dense) == list(range(len(boxes)))